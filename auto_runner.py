@@ -2,6 +2,10 @@ import subprocess
 import time
 import sys
 from datetime import datetime
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+from train_mp import DAEMON_ADDRESS, daemon_authkey
 
 # ----------------------------------------------------------------
 # Forzar la codificación UTF-8 en stdout
@@ -11,19 +15,27 @@ sys.stdout.reconfigure(encoding='utf-8')
 # ----------------------------------------------------------------
 # CONFIG — usa SIEMPRE el Python del venv con sys.executable
 # ----------------------------------------------------------------
+RUNS = 10
+GAMES_PER_RUN = 300
+
 BASE_CMD = [
     sys.executable,      # <-- Garantiza que use el Python del venv
     "train_mp.py",
-    "--runs", "10",
-    "--games-per-run", "300"
+    "--runs", str(RUNS),
+    "--games-per-run", str(GAMES_PER_RUN)
 ]
 
 START_SEED = 911
 WAIT_SECONDS = 3
 
+# Modo daemon: un único train_mp.py --serve atiende todas las seeds
+# (sin relanzar Python, numpy ni recargar las tablas Q en cada ciclo)
+USE_DAEMON = "--daemon" in sys.argv
+DAEMON_JOB = {"runs": RUNS, "games_per_run": GAMES_PER_RUN}
+
 SUCCESS_MESSAGES = [
     "=== TRAINING FINISHED ===",
-    "Logs guardados en logs/training_results.csv",
+    "Logs guardados en logs/training_results_v2.csv",
     "Q-values guardados correctamente."
 ]
 
@@ -55,6 +67,42 @@ def run_with_seed(seed: int) -> bool:
     return success
 
 
+def start_daemon():
+    """Lanza train_mp.py --serve en segundo plano y espera a que acepte conexiones."""
+    print("Iniciando daemon de entrenamiento…")
+    subprocess.Popen([sys.executable, "train_mp.py", "--serve"])
+
+    for _ in range(300):
+        try:
+            Client(DAEMON_ADDRESS, authkey=daemon_authkey()).close()
+            return
+        except (ConnectionRefusedError, FileNotFoundError, AuthenticationError):
+            time.sleep(0.1)  # aún no escucha (o la clave es la del daemon anterior)
+    raise RuntimeError("El daemon de entrenamiento no arrancó.")
+
+
+def run_with_seed_daemon(seed: int) -> bool:
+    """Envía la seed al daemon (train_mp.py --serve) y espera el resultado."""
+    print(f"\n\n=== Enviando run con SEED={seed} al daemon ===")
+
+    try:
+        conn = Client(DAEMON_ADDRESS, authkey=daemon_authkey())
+    except (ConnectionRefusedError, FileNotFoundError):
+        start_daemon()
+        conn = Client(DAEMON_ADDRESS, authkey=daemon_authkey())
+
+    with conn:
+        conn.send(dict(DAEMON_JOB, seed=seed))
+        reply = conn.recv()
+
+    if not reply["ok"]:
+        print(f"Error en el daemon: {reply['error']}")
+        return False
+
+    print(f"Campeones: {reply['champions']} ({reply['seconds']:.1f}s)")
+    return True
+
+
 def main():
     global shutdown_requested
 
@@ -67,7 +115,7 @@ def main():
             start_time = datetime.now()
             print(f"\n===== Nuevo ciclo — SEED {seed} — {start_time} =====")
 
-            ok = run_with_seed(seed)
+            ok = run_with_seed_daemon(seed) if USE_DAEMON else run_with_seed(seed)
 
             if ok:
                 print(f"[OK] SEED {seed} completado correctamente.")
@@ -0,0 +1,103 @@
+# ============================================================
+#          BUILD_BOOK.PY — LIBRO DE APERTURAS (OFFLINE)
+# ============================================================
+
+import argparse
+import time
+
+from connect4.book import BookPolicy, OpeningBook
+from connect4.connect_state import ConnectState
+from connect4.solver import Solver
+from connect4.symmetry import canonical_state_key
+
+
+# Prefijo mínimo: con 12-14 fichas una posición ya cuesta de 1 a 80 s y cada
+# ficha menos lo multiplica por ~10, así que por debajo no se intenta
+MIN_PREFIX = 12
+# Tope de posiciones por libro (--depth 2 desde un prefijo da < 60)
+MAX_POSITIONS = 500
+
+
+# ============================================================
+# Enumerar posiciones hasta N jugadas (sin repetir espejos)
+# ============================================================
+def enumerate_positions(depth, moves=""):
+    root = ConnectState()
+    for ch in moves:
+        root.play(int(ch))
+
+    frontier = {canonical_state_key(root)[0]: root}
+    positions = dict(frontier)
+
+    for _ in range(depth):
+        nxt = {}
+        for state in frontier.values():
+            if state.is_final():
+                continue
+            for col in state.get_free_cols():
+                child = state.transition(col)
+                key = canonical_state_key(child)[0]
+                if key not in positions:
+                    nxt[key] = child
+        positions.update(nxt)
+        frontier = nxt
+
+    return [s for s in positions.values() if not s.is_final()]
+
+
+# ============================================================
+# Resolver y escribir el libro
+# ============================================================
+def build_book(depth, out, moves, tt_bits=22, max_positions=MAX_POSITIONS):
+    if len(moves) < MIN_PREFIX:
+        raise ValueError(f"El prefijo necesita al menos {MIN_PREFIX} jugadas "
+                         f"(tiene {len(moves)}): el solver no termina más cerca de la apertura.")
+
+    positions = enumerate_positions(depth, moves)
+    if len(positions) > max_positions:
+        raise ValueError(f"{len(positions)} posiciones superan el tope de {max_positions} "
+                         f"(baja --depth o sube --max-positions).")
+    print(f"{len(positions)} posiciones a resolver (hasta {depth} jugadas desde '{moves}')")
+
+    solver = Solver(tt_bits)
+    keys, cols, scores = [], [], []
+    t0 = time.time()
+
+    for i, state in enumerate(positions, start=1):
+        key, remap = canonical_state_key(state)
+        col, score = solver.best_move(state)
+
+        keys.append(key)
+        cols.append(remap[col])  # columna canónica
+        scores.append(score)
+
+        print(f"  [{i}/{len(positions)}] col={col} score={score} "
+              f"nodos={solver.nodes} t={time.time() - t0:.1f}s")
+
+    OpeningBook.write(out, keys, cols, scores)
+    print(f"Libro guardado en {out}: {len(keys)} posiciones")
+
+
+# ============================================================
+# CLI
+# ============================================================
+def parse_args():
+    parser = argparse.ArgumentParser(description="Genera un libro de aperturas exacto.")
+    parser.add_argument("--depth", type=int, default=2,
+                        help="jugadas a enumerar desde el prefijo --moves")
+    parser.add_argument("--moves", type=str, required=True,
+                        help=f"prefijo de columnas de al menos {MIN_PREFIX} jugadas "
+                             f"(p.ej. '324115135152') desde el que enumerar")
+    parser.add_argument("--max-positions", type=int, default=MAX_POSITIONS,
+                        help="no resolver libros con más posiciones que esto")
+    parser.add_argument("--out", type=str, default=BookPolicy.DEFAULT_PATH)
+    parser.add_argument("--tt-bits", type=int, default=22)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        build_book(args.depth, args.out, args.moves, args.tt_bits, args.max_positions)
+    except ValueError as e:
+        raise SystemExit(f"[ERROR] {e}")
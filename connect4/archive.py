@@ -0,0 +1,205 @@
+import mmap
+import os
+import struct
+from typing import Iterator
+
+import numpy as np
+
+from connect4.dtos import CompactGame, pack_moves
+
+
+class GameArchive:
+    """
+    Archivo de partidas de solo-añadir, con índice de offsets.
+
+    - ``path``: cabecera de 16 bytes (magic ``C4GA``) y luego un registro por
+      partida, precedido por su longitud (uint16 little endian)
+    - ``path + ".idx"``: un uint64 por partida con el offset de su registro
+
+    Registro: winner (int8), jugadas (uint8), flags (uint8, bit 0 = hay
+    tiempos), los dos nombres (longitud uint8 + utf-8), las columnas
+    empaquetadas (medio byte por jugada, como CompactGame) y, si hay, un
+    float32 por jugada con los segundos que tardó.
+
+    El registro se vuelca al archivo antes de escribir su entrada del índice:
+    si el proceso muere a mitad, el lector simplemente no ve la última
+    partida. No se hace fsync, así que no protege ante un corte de luz.
+    """
+
+    MAGIC = b"C4GA"
+    MAX_NAME = 255  # bytes utf-8 (longitud en un uint8)
+    HEADER = struct.Struct("<4s12x")
+    LENGTH = struct.Struct("<H")
+    FIXED = struct.Struct("<bBB")
+
+    # ------------------------------------------------------
+    def __init__(self, path: str):
+        self.path = path
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._data = open(path, "ab")
+        self._index = open(path + ".idx", "ab")
+        if new:
+            self._data.write(self.HEADER.pack(self.MAGIC))
+
+    def __enter__(self) -> "GameArchive":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+    def flush(self):
+        self._data.flush()
+        self._index.flush()
+
+    # ------------------------------------------------------
+    def append(self, game: CompactGame):
+        self.append_moves(game.player_plus1, game.player_minus1, game.columns,
+                          game.winner, game.times or None)
+
+    def append_moves(self, player_plus1: str, player_minus1: str, cols, winner: int,
+                     times=None):
+        cols = list(cols)
+        plus, minus = player_plus1.encode(), player_minus1.encode()
+        for name in (plus, minus):
+            if len(name) > self.MAX_NAME:
+                raise ValueError(f"Nombre de jugador demasiado largo ({len(name)} bytes, "
+                                 f"máximo {self.MAX_NAME}): {name[:32]!r}…")
+
+        body = [
+            self.FIXED.pack(int(winner), len(cols), 1 if times is not None else 0),
+            bytes([len(plus)]), plus,
+            bytes([len(minus)]), minus,
+            pack_moves(cols),
+        ]
+        if times is not None:
+            body.append(np.asarray(times, dtype="<f4").tobytes())
+        record = b"".join(body)
+
+        offset = self._data.tell()
+        self._data.write(self.LENGTH.pack(len(record)))
+        self._data.write(record)
+        self._data.flush()  # el registro llega al archivo antes que su offset
+        self._index.write(struct.pack("<Q", offset))
+
+
+# ------------------------------------------------------
+class ArchiveReader:
+    """
+    Lector de un GameArchive: memmap del archivo y del índice.
+
+    ``reader[n]`` decodifica solo la partida n (O(1)); ``iter_games`` recorre
+    el archivo filtrando por jugador, ganador o longitud mirando solo la
+    cabecera de cada registro, sin cargar el resto.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, = GameArchive.HEADER.unpack(f.read(GameArchive.HEADER.size))
+        if magic != GameArchive.MAGIC:
+            raise ValueError(f"{path} no es un archivo de partidas.")
+
+        with open(path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        count = os.path.getsize(path + ".idx") // 8
+        if count == 0:
+            self.offsets = np.zeros(0, dtype=np.uint64)
+        else:
+            offsets = np.memmap(path + ".idx", dtype="<u8", mode="r", shape=(count,))
+            self.offsets = offsets[:self._complete(offsets)]
+
+    def _complete(self, offsets) -> int:
+        """Partidas del índice cuyo registro entero cabe en el mmap (un escritor puede ir por delante)."""
+        size = len(self._buf)
+        n = int(np.searchsorted(offsets, size - GameArchive.LENGTH.size, side="right"))
+        while n > 0:
+            start = int(offsets[n - 1])
+            length, = GameArchive.LENGTH.unpack_from(self._buf, start)
+            if start + GameArchive.LENGTH.size + length <= size:
+                break
+            n -= 1
+        return n
+
+    def close(self):
+        self._buf.close()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    # ------------------------------------------------------
+    def _header(self, n: int) -> tuple:
+        """(winner, jugadas, flags, +1, -1, offset de las jugadas) del registro n."""
+        buf = self._buf
+        pos = int(self.offsets[n]) + GameArchive.LENGTH.size
+        winner, n_moves, flags = GameArchive.FIXED.unpack_from(buf, pos)
+        pos += GameArchive.FIXED.size
+
+        size = buf[pos]
+        plus = buf[pos + 1:pos + 1 + size].decode()
+        pos += 1 + size
+        size = buf[pos]
+        minus = buf[pos + 1:pos + 1 + size].decode()
+        pos += 1 + size
+        return winner, n_moves, flags, plus, minus, pos
+
+    def __getitem__(self, n: int) -> CompactGame:
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError(n)
+
+        winner, n_moves, flags, plus, minus, pos = self._header(n)
+        packed = self._buf[pos:pos + (n_moves + 1) // 2]
+        times = None
+        if flags & 1:
+            pos += len(packed)
+            times = np.frombuffer(self._buf, dtype="<f4", count=n_moves, offset=pos).tolist()
+
+        return CompactGame.model_construct(player_plus1=plus, player_minus1=minus,
+                                           moves=packed, winner=winner, times=times or [])
+
+    def iter_games(self, player: str | None = None, winner: str | int | None = None,
+                   min_moves: int = 0, max_moves: int = 42) -> Iterator[tuple[int, CompactGame]]:
+        """
+        (n, partida) de las que cumplen los filtros:
+
+        - player: nombre que jugó con +1 o con -1
+        - winner: nombre del ganador, "draw", o 1 / -1 / 0 (bando)
+        - min_moves / max_moves: longitud de la partida
+        """
+        for n in range(len(self)):
+            w, n_moves, _, plus, minus, _ = self._header(n)
+            if not min_moves <= n_moves <= max_moves:
+                continue
+            if player is not None and player not in (plus, minus):
+                continue
+            if winner is not None:
+                if isinstance(winner, str):
+                    name = plus if w == 1 else minus if w == -1 else "draw"
+                    if name != winner:
+                        continue
+                elif w != winner:
+                    continue
+            yield n, self[n]
+
+    def table(self) -> dict[str, np.ndarray]:
+        """Columnas (jugadores, ganador, jugadas) de todas las partidas, p.ej. para pandas."""
+        rows = [self._header(n)[:5] for n in range(len(self))]
+        winner, n_moves, _, plus, minus = zip(*rows) if rows else ([],) * 5
+        return {
+            "player_plus1": np.array(plus, dtype=object),
+            "player_minus1": np.array(minus, dtype=object),
+            "winner": np.array(winner, dtype=np.int8),
+            "moves": np.array(n_moves, dtype=np.int16),
+        }
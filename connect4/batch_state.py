@@ -0,0 +1,134 @@
+from connect4.connect_state import ConnectState
+import numpy as np
+
+
+class BatchConnectState:
+    """
+    N partidas de Connect 4 en paralelo sobre un solo array (N, 6, 7) int8.
+
+    ``step(actions)`` aplica una jugada por partida con NumPy y devuelve los
+    vectores ``done`` / ``winner``. Con ``auto_reset=True`` las partidas que
+    terminan se reinician solas; si no, quedan congeladas (sus acciones se
+    ignoran) hasta que se llame a ``reset``.
+    """
+
+    ROWS = ConnectState.ROWS
+    COLS = ConnectState.COLS
+
+    # Índices (69, 4) de las celdas de cada línea ganadora
+    _LINE_R = ConnectState.LINES[:, :, 0].astype(np.intp)
+    _LINE_C = ConnectState.LINES[:, :, 1].astype(np.intp)
+
+    # ------------------------------------------------------
+    def __init__(self, n: int, player: int = -1, auto_reset: bool = True,
+                 boards: np.ndarray | None = None):
+        self.n = int(n)
+        self.start_player = int(player)
+        self.auto_reset = auto_reset
+
+        self.boards = np.zeros((self.n, self.ROWS, self.COLS), dtype=np.int8)
+        self.heights = np.zeros((self.n, self.COLS), dtype=np.int8)
+        self.player = np.full(self.n, self.start_player, dtype=np.int8)
+        self.empty_count = np.full(self.n, self.ROWS * self.COLS, dtype=np.int16)
+        self.winner = np.zeros(self.n, dtype=np.int8)
+
+        if boards is not None:
+            self.set_boards(boards)
+
+    # ------------------------------------------------------
+    def set_boards(self, boards: np.ndarray, player: np.ndarray | int | None = None):
+        """Carga tableros existentes (p.ej. N copias de una hoja de MCTS)."""
+        boards = np.asarray(boards, dtype=np.int8)
+        if boards.ndim == 2:
+            boards = np.broadcast_to(boards, (self.n, self.ROWS, self.COLS))
+        self.boards[:] = boards
+
+        self.heights[:] = np.count_nonzero(self.boards, axis=1)
+        self.empty_count[:] = self.ROWS * self.COLS - self.heights.sum(axis=1)
+
+        if player is None:
+            # En el torneo siempre empieza start_player
+            balance = self.boards.sum(axis=(1, 2), dtype=np.int16)
+            player = np.where(balance == 0, self.start_player, -self.start_player)
+        self.player[:] = player
+
+        # Ganador de tableros que ya vienen terminados
+        sums = self._line_sums(np.arange(self.n))
+        self.winner[:] = 0
+        self.winner[(sums == 4).any(axis=1)] = 1
+        self.winner[(sums == -4).any(axis=1)] = -1
+
+    # ------------------------------------------------------
+    def reset(self, idx: np.ndarray | None = None):
+        if idx is None:
+            idx = slice(None)
+        self.boards[idx] = 0
+        self.heights[idx] = 0
+        self.player[idx] = self.start_player
+        self.empty_count[idx] = self.ROWS * self.COLS
+        self.winner[idx] = 0
+
+    # ------------------------------------------------------
+    def is_final(self) -> np.ndarray:
+        return (self.winner != 0) | (self.empty_count == 0)
+
+    def legal_mask(self) -> np.ndarray:
+        """(N, 7) bool: columnas jugables de cada partida (vacío si terminó)."""
+        return (self.heights < self.ROWS) & ~self.is_final()[:, None]
+
+    def sample_actions(self, rng: np.random.Generator) -> np.ndarray:
+        """Una acción legal uniforme por partida (0 en partidas terminadas)."""
+        scores = rng.random((self.n, self.COLS))
+        scores[~self.legal_mask()] = -1.0
+        return scores.argmax(axis=1)
+
+    # ------------------------------------------------------
+    def _line_sums(self, idx: np.ndarray) -> np.ndarray:
+        # gather (k, 69, 4) + suma por línea -> (k, 69)
+        return self.boards[idx[:, None, None], self._LINE_R, self._LINE_C].sum(
+            axis=2, dtype=np.int8
+        )
+
+    # ------------------------------------------------------
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Aplica ``actions[i]`` en la partida i.
+
+        Returns
+        -------
+        (done, winner)
+            done[i] es True si la partida i es terminal tras la jugada y
+            winner[i] su ganador (1 / -1 / 0). Se calculan antes del auto-reset.
+
+        Raises
+        ------
+        ValueError
+            Si alguna columna está llena en una partida activa.
+        """
+        actions = np.asarray(actions, dtype=np.intp)
+        idx = np.flatnonzero(~self.is_final())
+        cols = actions[idx]
+
+        h = self.heights[idx, cols]
+        full = h >= self.ROWS
+        if full.any():
+            bad = idx[full]
+            raise ValueError(f"Column full in games {bad.tolist()[:10]}.")
+
+        players = self.player[idx]
+        self.boards[idx, self.ROWS - 1 - h, cols] = players
+        self.heights[idx, cols] += 1
+        self.empty_count[idx] -= 1
+
+        sums = self._line_sums(idx)
+        won = (sums == 4 * players[:, None]).any(axis=1)
+        self.winner[idx] = np.where(won, players, 0)
+        self.player[idx] = -players
+
+        done = self.is_final()
+        winner = self.winner.copy()
+
+        if self.auto_reset and done.any():
+            self.reset(np.flatnonzero(done))
+
+        return done, winner
@@ -0,0 +1,197 @@
+from connect4.environment_state import EnvironmentState
+import numpy as np
+from typing import List
+
+
+class BitboardConnectState(EnvironmentState):
+    """
+    Misma API que ConnectState, pero el tablero vive en dos enteros de 64 bits.
+
+    Cada columna ocupa ``ROWS + 1`` bits (el bit extra es un centinela que
+    evita que las líneas "den la vuelta" entre columnas). El bit
+    ``col * H1 + h`` corresponde a la ficha a altura ``h`` (0 = abajo).
+
+    - ``position``: fichas del jugador que tiene el turno
+    - ``mask``:     todas las fichas del tablero
+    """
+
+    ROWS = 6
+    COLS = 7
+    H1 = ROWS + 1
+
+    # ------------------------------------------------------
+    def __init__(self, board: np.ndarray | None = None, player: int = -1):
+        self.player = int(player)
+
+        if board is None:
+            self.position = 0
+            self.mask = 0
+            self.heights = [0] * self.COLS
+            self.empty_count = self.ROWS * self.COLS
+            self._winner = 0
+            return
+
+        board = np.asarray(board, dtype=np.int8)
+        self.mask = _board_to_bits(board != 0)
+        self.position = _board_to_bits(board == self.player)
+        self.heights = np.count_nonzero(board, axis=0).tolist()
+        self.empty_count = self.ROWS * self.COLS - int(np.count_nonzero(board))
+
+        # Ganador (si el tablero recibido ya es terminal)
+        self._winner = 0
+        if _has_four(self.position):
+            self._winner = self.player
+        elif _has_four(self.position ^ self.mask):
+            self._winner = -self.player
+
+    # ------------------------------------------------------
+    @classmethod
+    def from_board(cls, board: np.ndarray, player: int | None = None):
+        """Construye el estado desde el tablero numpy que reciben las policies."""
+        if player is None:
+            player = player_to_move(board)
+        return cls(board, player)
+
+    def to_board(self) -> np.ndarray:
+        """Convierte las máscaras al tablero numpy (6x7, int8) sin pérdidas."""
+        own = _bits_to_board(self.position)
+        other = _bits_to_board(self.position ^ self.mask)
+        board = np.zeros((self.ROWS, self.COLS), dtype=np.int8)
+        board[own] = self.player
+        board[other] = -self.player
+        return board
+
+    @property
+    def board(self) -> np.ndarray:
+        return self.to_board()
+
+    # ------------------------------------------------------
+    def transition_fast(self, col: int):
+        h = self.heights[col]
+        if h >= self.ROWS:
+            raise ValueError(f"Column {col} is full.")
+
+        bit = 1 << (col * self.H1 + h)
+        mover = self.position | bit
+
+        self.mask |= bit
+        self.heights[col] = h + 1
+        self.empty_count -= 1
+
+        self._winner = self.player if _has_four(mover) else 0
+
+        # Cambiar turno: ahora "position" son las fichas del rival
+        self.position = mover ^ self.mask
+        self.player = -self.player
+        return self
+
+    # ------------------------------------------------------
+    def transition(self, col: int):
+        return self.clone().transition_fast(col)
+
+    def clone(self):
+        new = BitboardConnectState.__new__(BitboardConnectState)
+        new.player = self.player
+        new.position = self.position
+        new.mask = self.mask
+        new.heights = self.heights[:]
+        new.empty_count = self.empty_count
+        new._winner = self._winner
+        return new
+
+    # ------------------------------------------------------
+    def is_final(self) -> bool:
+        return self._winner != 0 or self.empty_count == 0
+
+    def get_winner(self) -> int:
+        return self._winner
+
+    # ------------------------------------------------------
+    def is_applicable(self, col: int) -> bool:
+        return (
+            0 <= col < self.COLS
+            and self.heights[col] < self.ROWS
+            and not self.is_final()
+        )
+
+    # ------------------------------------------------------
+    def get_free_cols(self) -> List[int]:
+        return [c for c in range(self.COLS) if self.heights[c] < self.ROWS]
+
+    # ------------------------------------------------------
+    def get_heights(self) -> List[int]:
+        return self.heights[:]
+
+
+# ------------------------------------------------------
+# Utilidades de bits
+# ------------------------------------------------------
+
+# Máscaras por columna (bit ``col * H1 + h``, ver BitboardConnectState)
+_H1 = BitboardConnectState.H1
+BOTTOM = [1 << (c * _H1) for c in range(BitboardConnectState.COLS)]
+TOP = [1 << (c * _H1 + BitboardConnectState.ROWS - 1) for c in range(BitboardConnectState.COLS)]
+COLUMN = [((1 << BitboardConnectState.ROWS) - 1) << (c * _H1) for c in range(BitboardConnectState.COLS)]
+
+
+def _has_four(bb: int) -> bool:
+    """True si el bitboard tiene 4 en línea (test de desplazamiento + AND)."""
+    H1 = BitboardConnectState.H1
+
+    # Horizontal
+    m = bb & (bb >> H1)
+    if m & (m >> (2 * H1)):
+        return True
+
+    # Vertical
+    m = bb & (bb >> 1)
+    if m & (m >> 2):
+        return True
+
+    # Diagonal ↗
+    m = bb & (bb >> (H1 + 1))
+    if m & (m >> (2 * (H1 + 1))):
+        return True
+
+    # Diagonal ↘
+    m = bb & (bb >> (H1 - 1))
+    if m & (m >> (2 * (H1 - 1))):
+        return True
+
+    return False
+
+
+def is_winning_move(position: int, mask: int, col: int) -> bool:
+    """True si ``position`` (el jugador con el turno) gana jugando en ``col``."""
+    return _has_four(position | ((mask + BOTTOM[col]) & COLUMN[col]))
+
+
+def player_to_move(board: np.ndarray) -> int:
+    """Deduce el turno contando fichas (en el torneo siempre empieza -1)."""
+    ones = np.count_nonzero(board == 1)
+    negs = np.count_nonzero(board == -1)
+    return -1 if ones == negs else 1
+
+
+def _compute_bit_shifts() -> np.ndarray:
+    ROWS = BitboardConnectState.ROWS
+    COLS = BitboardConnectState.COLS
+    H1 = BitboardConnectState.H1
+
+    shifts = np.zeros((ROWS, COLS), dtype=np.uint64)
+    for r in range(ROWS):
+        for c in range(COLS):
+            shifts[r, c] = c * H1 + (ROWS - 1 - r)
+    return shifts
+
+
+# Posición del bit de cada celda (fila 0 = arriba, como en ConnectState)
+_BIT_SHIFTS = _compute_bit_shifts()
+
+
+def _board_to_bits(cells: np.ndarray) -> int:
+    return int(np.bitwise_or.reduce(np.uint64(1) << _BIT_SHIFTS[cells], initial=np.uint64(0)))
+
+
+def _bits_to_board(bb: int) -> np.ndarray:
+    return ((np.uint64(bb) >> _BIT_SHIFTS) & np.uint64(1)).astype(bool)
@@ -0,0 +1,113 @@
+import os
+import struct
+import numpy as np
+
+from connect4.policy import Policy
+from connect4.symmetry import canonical_key
+
+
+class OpeningBook:
+    """
+    Libro de aperturas: posición canónica -> (mejor columna, puntuación exacta).
+
+    Formato del archivo (little endian):
+
+    - cabecera de 16 bytes: magic ``C4BK``, count (uint64), 4 bytes libres
+    - ``count`` claves canónicas uint64, ordenadas
+    - ``count`` columnas canónicas int8
+    - ``count`` puntuaciones int8 (convención de connect4.solver)
+
+    Se abre con numpy.memmap y cada consulta es una búsqueda binaria.
+    """
+
+    MAGIC = b"C4BK"
+    HEADER = struct.Struct("<4sQ4x")
+
+    # ------------------------------------------------------
+    def __init__(self, keys: np.ndarray, moves: np.ndarray, scores: np.ndarray):
+        self.keys = keys
+        self.moves = moves
+        self.scores = scores
+
+    @classmethod
+    def open(cls, path: str) -> "OpeningBook":
+        with open(path, "rb") as f:
+            magic, count = cls.HEADER.unpack(f.read(cls.HEADER.size))
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path} no es un libro de aperturas.")
+        if count == 0:
+            return cls(np.zeros(0, np.uint64), np.zeros(0, np.int8), np.zeros(0, np.int8))
+
+        offset = cls.HEADER.size
+        keys = np.memmap(path, dtype=np.uint64, mode="r", offset=offset, shape=(count,))
+        offset += keys.nbytes
+        moves = np.memmap(path, dtype=np.int8, mode="r", offset=offset, shape=(count,))
+        offset += count
+        scores = np.memmap(path, dtype=np.int8, mode="r", offset=offset, shape=(count,))
+        return cls(keys, moves, scores)
+
+    @classmethod
+    def write(cls, path: str, keys, moves, scores) -> None:
+        keys = np.asarray(keys, dtype=np.uint64)
+        order = np.argsort(keys, kind="stable")
+
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, len(keys)))
+            f.write(keys[order].tobytes())
+            f.write(np.asarray(moves, dtype=np.int8)[order].tobytes())
+            f.write(np.asarray(scores, dtype=np.int8)[order].tobytes())
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def lookup(self, board: np.ndarray) -> tuple[int, int] | None:
+        """(columna real, puntuación) para el tablero, o None si no está en el libro."""
+        key, cols = canonical_key(board)
+        i = int(np.searchsorted(self.keys, np.uint64(key)))
+        if i < len(self.keys) and self.keys[i] == key:
+            return cols[int(self.moves[i])], int(self.scores[i])
+        return None
+
+
+# ------------------------------------------------------
+class BookPolicy(Policy):
+    """
+    Envuelve otra policy: responde desde el libro cuando la posición está en
+    él y, si no, delega en la policy envuelta (mount/final también se delegan).
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "opening_book.bin")
+
+    def __init__(self, policy: Policy, path: str | None = None):
+        self.policy = policy
+        self.path = path or self.DEFAULT_PATH
+        self._book = None  # se abre en el primer uso
+
+    @property
+    def book(self) -> OpeningBook:
+        if self._book is None:
+            if os.path.exists(self.path):
+                self._book = OpeningBook.open(self.path)
+            else:
+                self._book = OpeningBook(np.zeros(0, np.uint64), np.zeros(0, np.int8),
+                                         np.zeros(0, np.int8))
+        return self._book
+
+    def mount(self, time_out=None) -> None:
+        if time_out is None:
+            self.policy.mount()
+        else:
+            self.policy.mount(time_out)
+
+    def act(self, s: np.ndarray) -> int:
+        hit = self.book.lookup(s)
+        if hit is not None:
+            return hit[0]
+        return self.policy.act(s)
+
+    def final(self, reward: int):
+        if hasattr(self.policy, "final"):
+            self.policy.final(reward)
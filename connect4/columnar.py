@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+
+
+class ColumnarSink:
+    """
+    Filas (dicts con las mismas claves) guardadas por columnas.
+
+    Cada ``write`` añade un trozo por columna: ``directory/<columna>/<n>.npy``.
+    Los números quedan como arrays numéricos y los textos como unicode de
+    ancho fijo, así que cada trozo se puede abrir con ``np.load(mmap_mode="r")``
+    sin leer el resto. ``load_columns`` junta todos los trozos.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._chunk = _next_chunk(directory)
+
+    def write(self, rows: list[dict]):
+        if not rows:
+            return
+        for column in rows[0]:
+            path = os.path.join(self.directory, column)
+            os.makedirs(path, exist_ok=True)
+            values = np.asarray([row[column] for row in rows])
+            np.save(os.path.join(path, f"{self._chunk:06d}.npy"), values)
+        self._chunk += 1
+
+
+def _next_chunk(directory: str) -> int:
+    chunks = [
+        int(name[:-4])
+        for column in os.listdir(directory)
+        if os.path.isdir(os.path.join(directory, column))
+        for name in os.listdir(os.path.join(directory, column))
+        if name.endswith(".npy")
+    ]
+    return max(chunks, default=-1) + 1
+
+
+def load_columns(directory: str, mmap: bool = True) -> dict[str, np.ndarray]:
+    """{columna: array} con todos los trozos en orden (trozos abiertos con memmap)."""
+    columns = {}
+    for column in sorted(os.listdir(directory)):
+        path = os.path.join(directory, column)
+        if not os.path.isdir(path):
+            continue
+        chunks = [
+            np.load(os.path.join(path, name), mmap_mode="r" if mmap else None)
+            for name in sorted(os.listdir(path)) if name.endswith(".npy")
+        ]
+        if chunks:
+            columns[column] = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+    return columns
@@ -18,22 +18,29 @@ class ConnectState(EnvironmentState):
 
         self.player = int(player)
 
-        # Alturas O(1)
-        self.heights = np.zeros(self.COLS, dtype=np.int8)
-        for c in range(self.COLS):
-            col = self.board[:, c]
-            nz = np.nonzero(col)[0]
-            if nz.size == 0:
-                self.heights[c] = 0
-            else:
-                self.heights[c] = self.ROWS - nz[0]
+        # Alturas O(1) (con gravedad, altura = fichas en la columna)
+        self.heights = np.count_nonzero(self.board, axis=0).astype(np.int8)
 
         # Espacios libres
-        self.empty_count = int(np.count_nonzero(self.board == 0))
+        self.empty_count = int(self.ROWS * self.COLS - self.heights.sum())
 
         # Cache del ganador
         self._winner = 0
 
+        # Pila de jugadas para undo(): (fila, columna, ganador previo)
+        self._moves = []
+
+        # Zobrist incremental: hash del tablero y del tablero con colores
+        # invertidos (-board), más el balance de fichas (unos - menos unos)
+        self._hash = zobrist_hash(self.board)
+        self._hash_swap = zobrist_hash(-self.board)
+
+        # Lo mismo para el tablero espejado (izquierda <-> derecha)
+        mirror = self.board[:, ::-1]
+        self._hash_mirror = zobrist_hash(mirror)
+        self._hash_mirror_swap = zobrist_hash(-mirror)
+        self._balance = int(self.board.sum(dtype=np.int16))
+
     # ------------------------------------------------------
     def _check_after_move(self, row: int, col: int) -> int:
         player = self.board[row, col]
@@ -83,15 +90,93 @@ class ConnectState(EnvironmentState):
         self.heights[col] += 1
         self.empty_count -= 1
 
+        self._moves.append((row, col, self._winner))
         self._winner = self._check_after_move(row, col)
+        self._toggle_hash(row, col, self.player)
+        self._balance += self.player
 
         self.player = -self.player
         return self
 
+    def _toggle_hash(self, row: int, col: int, player: int):
+        i = row * self.COLS + col
+        m = row * self.COLS + (self.COLS - 1 - col)
+        if player == 1:
+            self._hash ^= _Z_PLUS[i]
+            self._hash_swap ^= _Z_MINUS[i]
+            self._hash_mirror ^= _Z_PLUS[m]
+            self._hash_mirror_swap ^= _Z_MINUS[m]
+        else:
+            self._hash ^= _Z_MINUS[i]
+            self._hash_swap ^= _Z_PLUS[i]
+            self._hash_mirror ^= _Z_MINUS[m]
+            self._hash_mirror_swap ^= _Z_PLUS[m]
+
+    # ------------------------------------------------------
+    def play(self, col: int):
+        """Jugada in-place (sin copias); se deshace con undo()."""
+        return self.transition_fast(col)
+
+    def undo(self):
+        """Deshace la última jugada en O(1)."""
+        row, col, prev_winner = self._moves.pop()
+
+        self.board[row, col] = 0
+        self.heights[col] -= 1
+        self.empty_count += 1
+        self._winner = prev_winner
+        self.player = -self.player
+
+        # XOR es su propia inversa
+        self._toggle_hash(row, col, self.player)
+        self._balance -= self.player
+        return self
+
+    # ------------------------------------------------------
+    def key(self, normalize: bool = False, side_to_move: bool = False) -> int:
+        """
+        Clave Zobrist de 64 bits del estado, en O(1).
+
+        - normalize: invierte colores si hay más fichas -1 que +1 (la misma
+          normalización que usa Group B), sin copiar el tablero.
+        - side_to_move: mezcla el turno en la clave (XOR con ZOBRIST_SIDE).
+        """
+        flip = normalize and self._balance < 0
+        h = self._hash_swap if flip else self._hash
+
+        if side_to_move and (-self.player if flip else self.player) == 1:
+            h ^= _Z_SIDE
+        return h
+
+    def mirror_key(self, normalize: bool = False, side_to_move: bool = False) -> int:
+        """Como key(), pero del tablero espejado (columna c -> COLS - 1 - c)."""
+        flip = normalize and self._balance < 0
+        h = self._hash_mirror_swap if flip else self._hash_mirror
+
+        if side_to_move and (-self.player if flip else self.player) == 1:
+            h ^= _Z_SIDE
+        return h
+
+    # ------------------------------------------------------
+    def clone(self):
+        """Copia barata: copia los campos guardados en vez de recalcularlos."""
+        new = ConnectState.__new__(ConnectState)
+        new.board = self.board.copy()
+        new.player = self.player
+        new.heights = self.heights.copy()
+        new.empty_count = self.empty_count
+        new._winner = self._winner
+        new._moves = self._moves[:]
+        new._hash = self._hash
+        new._hash_swap = self._hash_swap
+        new._hash_mirror = self._hash_mirror
+        new._hash_mirror_swap = self._hash_mirror_swap
+        new._balance = self._balance
+        return new
+
     # ------------------------------------------------------
     def transition(self, col: int):
-        new = ConnectState(self.board.copy(), self.player)
-        return new.transition_fast(col)
+        return self.clone().transition_fast(col)
 
     # ------------------------------------------------------
     def is_final(self) -> bool:
@@ -151,3 +236,39 @@ def _compute_lines():
 
 # Asignar el resultado a la clase (ya existe aquí)
 ConnectState.LINES = _compute_lines()
+
+
+# ------------------------------------------------------
+# TABLAS ZOBRIST (semilla fija: las claves son estables entre procesos)
+# ------------------------------------------------------
+
+def _compute_zobrist():
+    rng = np.random.default_rng(0xC0FFEE)
+    top = np.iinfo(np.uint64).max
+    shape = (2, ConnectState.ROWS, ConnectState.COLS)
+    table = rng.integers(1, top, size=shape, dtype=np.uint64, endpoint=True)
+    side = int(rng.integers(1, top, dtype=np.uint64, endpoint=True))
+    return table, side
+
+
+# ZOBRIST[0] -> fichas +1, ZOBRIST[1] -> fichas -1
+ZOBRIST, ZOBRIST_SIDE = _compute_zobrist()
+
+_Z_PLUS = [int(z) for z in ZOBRIST[0].reshape(-1)]
+_Z_MINUS = [int(z) for z in ZOBRIST[1].reshape(-1)]
+_Z_SIDE = ZOBRIST_SIDE
+
+
+def zobrist_hash(board: np.ndarray) -> int:
+    """Hash Zobrist de un tablero numpy (vectorizado, sin bucles por celda)."""
+    zero = np.uint64(0)
+    h = np.bitwise_xor.reduce(ZOBRIST[0][board == 1], initial=zero)
+    h ^= np.bitwise_xor.reduce(ZOBRIST[1][board == -1], initial=zero)
+    return int(h)
+
+
+def zobrist_hash_many(boards: np.ndarray) -> np.ndarray:
+    """Hashes Zobrist (N,) uint64 de N tableros (N, 6, 7) a la vez."""
+    zero = np.uint64(0)
+    cells = np.where(boards == 1, ZOBRIST[0], zero) ^ np.where(boards == -1, ZOBRIST[1], zero)
+    return np.bitwise_xor.reduce(cells.reshape(len(boards), -1), axis=1)
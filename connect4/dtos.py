@@ -1,7 +1,9 @@
 from pydantic import BaseModel, ConfigDict, Field
-from typing import List, Tuple, Union
+from typing import Iterator, List, Tuple, Union
 import numpy as np
 
+from connect4.connect_state import ConnectState
+
 State = List[List[int]]
 Action = int
 Participant = Tuple[str, type]
@@ -23,6 +25,106 @@ class Game(BaseModel):
     history: List[Tuple[State, Action]]  # siempre listas, nunca numpy array
 
 
+# ------------------------------------------------------
+# Partida compacta: solo la secuencia de columnas
+# ------------------------------------------------------
+_PAD = 0xF  # nibble de relleno cuando el número de jugadas es impar
+
+
+def pack_moves(cols) -> bytes:
+    """Columnas (0..6) empaquetadas de 2 en 2 por byte (nibble alto primero)."""
+    nibbles = np.asarray(list(cols), dtype=np.uint8)
+    if len(nibbles) % 2:
+        nibbles = np.append(nibbles, np.uint8(_PAD))
+    return ((nibbles[0::2] << 4) | nibbles[1::2]).tobytes()
+
+
+def unpack_moves(data: bytes) -> List[int]:
+    packed = np.frombuffer(data, dtype=np.uint8)
+    nibbles = np.empty(2 * len(packed), dtype=np.uint8)
+    nibbles[0::2] = packed >> 4
+    nibbles[1::2] = packed & 0xF
+    if len(nibbles) and nibbles[-1] == _PAD:
+        nibbles = nibbles[:-1]
+    return nibbles.tolist()
+
+
+class CompactGame(BaseModel):
+    """
+    UNA partida guardada como lista de jugadas (medio byte por jugada):
+    - quién fue +1 y quién fue -1
+    - columnas jugadas en orden (empieza -1), empaquetadas en ``moves``
+      (en JSON, texto hexadecimal: un carácter por jugada)
+    - ganador (1 / -1 / 0) y segundos que tardó cada jugada
+
+    Los tableros no se guardan: se reconstruyen con ConnectState al pedirlos.
+    """
+    model_config = ConfigDict(ser_json_bytes="hex", val_json_bytes="hex")
+
+    player_plus1: str
+    player_minus1: str
+    moves: bytes
+    winner: int = 0
+    times: List[float] = Field(default_factory=list)
+
+    @classmethod
+    def from_moves(cls, player_plus1: str, player_minus1: str, cols, winner: int = 0,
+                   times=None) -> "CompactGame":
+        """Construcción rápida SIN validación (model_construct) para escribir muchas partidas."""
+        return cls.model_construct(
+            player_plus1=player_plus1,
+            player_minus1=player_minus1,
+            moves=pack_moves(cols),
+            winner=int(winner),
+            times=list(times) if times is not None else [],
+        )
+
+    @classmethod
+    def from_game(cls, game: "Game") -> "CompactGame":
+        """Convierte una partida del formato antiguo (tablero completo por jugada)."""
+        cols = [action for _, action in game.history]
+        state = ConnectState()
+        for col in cols:
+            state.play(col)
+        return cls.from_moves(game.player_plus1, game.player_minus1, cols, state.get_winner())
+
+    # ------------------------------------------------------
+    @property
+    def columns(self) -> List[int]:
+        return unpack_moves(self.moves)
+
+    def __len__(self) -> int:
+        n = 2 * len(self.moves)
+        return n - 1 if self.moves and self.moves[-1] & 0xF == _PAD else n
+
+    def states(self) -> Iterator[ConnectState]:
+        """Estados ANTES de cada jugada (y el final), reconstruidos sobre la marcha."""
+        state = ConnectState()
+        yield state.clone()
+        for col in self.columns:
+            state.play(col)
+            yield state.clone()
+
+    def board_at(self, ply: int) -> np.ndarray:
+        """Tablero tras ``ply`` jugadas."""
+        state = ConnectState()
+        for col in self.columns[:ply]:
+            state.play(col)
+        return state.board.copy()
+
+    @property
+    def history(self) -> List[Tuple[State, Action]]:
+        """El historial (estado, acción) del formato antiguo, reconstruido."""
+        return [(s.board.tolist(), col) for s, col in zip(self.states(), self.columns)]
+
+
+def game_history(game: dict) -> List[Tuple[State, Action]]:
+    """Historial (estado, acción) de una partida leída de JSON, en cualquiera de los dos formatos."""
+    if "moves" in game:
+        return CompactGame.model_validate(game).history
+    return game["history"]
+
+
 class Match(BaseModel):
     """
     Un match de (best of N) partidas.
@@ -36,4 +138,4 @@ class Match(BaseModel):
     player_b_wins: int = 0
     draws: int = 0
 
-    games: List[Game] = Field(default_factory=list)
+    games: List[Union[CompactGame, Game]] = Field(default_factory=list)
@@ -0,0 +1,96 @@
+import numpy as np
+
+from connect4.qtable import QTable
+
+
+class ExperienceBuffer:
+    """
+    Episodios (estado, acción, jugadas legales, recompensa final) de varias
+    partidas, aplicados a una QTable de una sola vez con ``flush``.
+
+    Objetivos de la actualización ``Q <- Q + alpha * (objetivo - Q)``:
+
+    - ``td_lambda=None`` (por defecto): Monte Carlo, objetivo = recompensa
+      descontada ``gamma**(pasos hasta el final) * r`` (con gamma=1, la
+      recompensa tal cual, como el ``final`` original)
+    - ``td_lambda`` en [0, 1]: lambda-return con bootstrap sobre
+      ``max Q(s')`` de las jugadas legales, calculado con la tabla del
+      momento del flush, hacia atrás y vectorizado sobre los episodios
+      (rellenados a la misma longitud)
+
+    Las actualizaciones se aplican en el orden en que se jugaron, así que
+    el Monte Carlo da lo mismo que actualizar partida a partida.
+    """
+
+    def __init__(self, flush_every: int = 16, alpha: float = 0.2, gamma: float = 1.0,
+                 td_lambda: float | None = None):
+        self.flush_every = flush_every
+        self.alpha = alpha
+        self.gamma = gamma
+        self.td_lambda = td_lambda
+        self.episodes = []  # (claves, acciones, legales, recompensa)
+
+    def __len__(self) -> int:
+        return len(self.episodes)
+
+    # ------------------------------------------------------
+    def add(self, keys, actions, legal, reward: float) -> bool:
+        """Guarda un episodio; devuelve True si ya toca hacer flush."""
+        if len(keys):
+            self.episodes.append((keys, actions, legal, reward))
+        return len(self.episodes) >= self.flush_every
+
+    def clear(self):
+        self.episodes.clear()
+
+    def flush(self, q: QTable):
+        """Aplica todos los episodios pendientes a ``q`` y vacía el buffer."""
+        if not self.episodes:
+            return
+
+        lengths = np.array([len(e[0]) for e in self.episodes])
+        keys = np.concatenate([np.asarray(e[0], dtype=np.uint64) for e in self.episodes])
+        actions = np.concatenate([np.asarray(e[1], dtype=np.intp) for e in self.episodes])
+        rewards = np.array([e[3] for e in self.episodes], dtype=np.float64)
+
+        if self.td_lambda is None:
+            targets = self._mc_targets(lengths, rewards)
+        else:
+            legal = np.concatenate([np.asarray(e[2], dtype=bool) for e in self.episodes])
+            targets = self._td_lambda_targets(q, lengths, keys, legal, rewards)
+
+        q.update_many(keys, actions, targets, self.alpha)
+        self.episodes.clear()
+
+    # ------------------------------------------------------
+    def _mc_targets(self, lengths, rewards) -> np.ndarray:
+        targets = np.repeat(rewards, lengths)
+        if self.gamma != 1.0:
+            starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+            to_end = np.repeat(lengths, lengths) - 1 - (np.arange(len(targets)) - starts)
+            targets = targets * self.gamma ** to_end
+        return targets
+
+    def _td_lambda_targets(self, q, lengths, keys, legal, rewards) -> np.ndarray:
+        n_episodes, width = len(lengths), int(lengths.max())
+        valid = np.arange(width) < lengths[:, None]  # (E, T) máscara de relleno
+
+        # V(s) = max Q(s, a) legal, con la tabla actual
+        rows = np.where(legal, q.lookup_many(keys), -np.inf)
+        flat_v = rows.max(axis=1)
+        values = np.zeros((n_episodes, width))
+        values[valid] = np.where(np.isfinite(flat_v), flat_v, 0.0)
+
+        # Hacia atrás: G_T-1 = r ; G_t = gamma * ((1 - lambda) V(s_t+1) + lambda G_t+1)
+        lam, gamma = self.td_lambda, self.gamma
+        returns = np.zeros((n_episodes, width))
+        last = lengths - 1
+        ahead = np.zeros(n_episodes)
+        for t in range(width - 1, -1, -1):
+            is_last = last == t
+            bootstrap = values[:, t + 1] if t + 1 < width else 0.0
+            g = gamma * ((1 - lam) * bootstrap + lam * ahead)
+            ahead = np.where(is_last, rewards, g)
+            returns[:, t] = ahead
+
+        return returns[valid]
@@ -11,3 +11,37 @@ class Policy(ABC):
     @abstractmethod
     def act(self, s: np.ndarray) -> int:
         pass
+
+    # Interfaz por lotes (opcional) ------------------------
+    # Las policies que la implementan de forma nativa juegan muchas partidas
+    # a la vez: una llamada por jugada para todas ellas (ver
+    # tournament.play_policies_batch). Su rival puede usar la versión por
+    # defecto (act() fila a fila) salvo que tenga STATEFUL_GAMES = True.
+
+    # True si act() guarda datos de la partida en curso para final() (p.ej. la
+    # memoria de aprendizaje): el act_batch por defecto mezclaría las partidas
+    # del lote, así que sin act_batch propio juega siempre partida a partida.
+    STATEFUL_GAMES = False
+
+    def mount_batch(self, n: int) -> None:
+        """Prepara ``n`` partidas simultáneas."""
+        self.mount()
+
+    def act_batch(self, boards: np.ndarray, legal_mask: np.ndarray,
+                  rows: np.ndarray | None = None) -> np.ndarray:
+        """
+        Acciones para ``boards`` (k, 6, 7) con jugadas legales ``legal_mask`` (k, 7).
+        ``rows`` indica a qué partidas del lote pertenecen. Por defecto llama a act().
+        """
+        return np.array([self.act(b) for b in boards], dtype=np.int64)
+
+    def final_batch(self, rewards: np.ndarray) -> None:
+        """Recompensa final de cada una de las ``n`` partidas del lote."""
+        if hasattr(self, "final"):
+            for r in rewards:
+                self.final(int(r))
+
+
+def has_native_batch(policy: Policy) -> bool:
+    """True si la policy implementa act_batch por sí misma (no el bucle por defecto)."""
+    return type(policy).act_batch is not Policy.act_batch
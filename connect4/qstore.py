@@ -0,0 +1,152 @@
+import argparse
+import json
+import os
+import struct
+import numpy as np
+
+from connect4.symmetry import canonical_key_from_hex
+
+
+class QStore:
+    """
+    Tabla Q de solo lectura en disco, servida con numpy.memmap.
+
+    Formato del archivo (little endian):
+
+    - cabecera de 32 bytes: magic ``C4Q1``, n_actions (uint32), count (uint64)
+    - ``count`` claves de estado uint64, ordenadas
+    - ``count * n_actions`` valores float32 (una fila por estado)
+
+    Abrir el archivo no lee nada: las páginas se cargan al consultarlas, así
+    que el arranque es inmediato y la memoria residente no crece con la tabla.
+    Las búsquedas son binarias (np.searchsorted) sobre las claves ordenadas.
+    """
+
+    MAGIC = b"C4Q1"
+    HEADER = struct.Struct("<4sIQ16x")
+
+    # ------------------------------------------------------
+    def __init__(self, keys: np.ndarray, values: np.ndarray):
+        self.keys = keys
+        self.values = values
+
+    @classmethod
+    def empty(cls, n_actions: int = 7) -> "QStore":
+        return cls(np.zeros(0, dtype=np.uint64), np.zeros((0, n_actions), dtype=np.float32))
+
+    @classmethod
+    def open(cls, path: str) -> "QStore":
+        with open(path, "rb") as f:
+            magic, n_actions, count = cls.HEADER.unpack(f.read(cls.HEADER.size))
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path} no es un archivo QStore.")
+        if count == 0:
+            return cls.empty(n_actions)
+
+        offset = cls.HEADER.size
+        keys = np.memmap(path, dtype=np.uint64, mode="r", offset=offset, shape=(count,))
+        offset += keys.nbytes
+        values = np.memmap(path, dtype=np.float32, mode="r", offset=offset,
+                           shape=(count, n_actions))
+        return cls(keys, values)
+
+    # ------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: int) -> bool:
+        return self.find(key) >= 0
+
+    def find(self, key: int) -> int:
+        """Índice de la fila de ``key`` o -1 si no está."""
+        i = int(np.searchsorted(self.keys, np.uint64(key)))
+        if i < len(self.keys) and self.keys[i] == key:
+            return i
+        return -1
+
+    def find_many(self, keys: np.ndarray) -> np.ndarray:
+        """Versión vectorizada de find()."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        if len(self.keys) == 0:
+            return np.full(len(keys), -1, dtype=np.intp)
+        idx = np.searchsorted(self.keys, keys)
+        idx[idx >= len(self.keys)] = 0
+        return np.where(self.keys[idx] == keys, idx, -1)
+
+    def get(self, key: int) -> np.ndarray | None:
+        """Fila de valores (n_actions,) de ``key`` o None."""
+        i = self.find(key)
+        return None if i < 0 else self.values[i]
+
+    # ------------------------------------------------------
+    @classmethod
+    def write(cls, path: str, keys: np.ndarray, values: np.ndarray) -> None:
+        """Escribe la tabla (ordenando por clave) en un temporal y luego renombra."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        values = np.asarray(values, dtype=np.float32)
+        order = np.argsort(keys, kind="stable")
+
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, values.shape[1], len(keys)))
+            f.write(keys[order].tobytes())
+            f.write(values[order].tobytes())
+        os.replace(tmp, path)
+
+
+# ------------------------------------------------------
+# Conversión desde qvalues.json
+# ------------------------------------------------------
+
+def parse_json_key(key: str) -> tuple[int, int]:
+    """
+    Traduce una clave "<estado>|<columna>" de qvalues.json a (clave, columna).
+
+    El estado puede ser la clave canónica en hex (16 caracteres) o el
+    tablero en hex del formato antiguo (84 caracteres), que se canonicaliza.
+    """
+    state, col = key.split("|")
+    if len(state) == 2 * 42:
+        k, cols = canonical_key_from_hex(state)
+        return k, cols[int(col)]
+    return int(state, 16), int(col)
+
+
+def convert_json(json_path: str, bin_path: str, n_actions: int = 7) -> int:
+    """Convierte qvalues.json al formato binario. Devuelve el número de estados."""
+    with open(json_path, "r") as f:
+        text = f.read().strip()
+    q = json.loads(text) if text else {}
+
+    n = len(q)
+    keys = np.empty(n, dtype=np.uint64)
+    cols = np.empty(n, dtype=np.intp)
+    vals = np.empty(n, dtype=np.float64)
+    for i, (k, v) in enumerate(q.items()):
+        keys[i], cols[i] = parse_json_key(k)
+        vals[i] = v
+
+    # Agrupar por estado y promediar duplicados (p.ej. estados espejados)
+    uniq, inv = np.unique(keys, return_inverse=True)
+    sums = np.zeros((len(uniq), n_actions))
+    counts = np.zeros((len(uniq), n_actions))
+    np.add.at(sums, (inv, cols), vals)
+    np.add.at(counts, (inv, cols), 1)
+    values = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+    QStore.write(bin_path, uniq, values)
+    return len(uniq)
+
+
+# ------------------------------------------------------
+def parse_args():
+    parser = argparse.ArgumentParser(description="Convierte qvalues.json a QStore binario.")
+    parser.add_argument("json_path")
+    parser.add_argument("bin_path")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    n = convert_json(args.json_path, args.bin_path)
+    print(f"{n} estados escritos en {args.bin_path}")
@@ -0,0 +1,225 @@
+import os
+import numpy as np
+
+from connect4.qstore import QStore
+
+
+class QTable:
+    """
+    Tabla Q en memoria con claves enteras y una fila de float32 por estado.
+
+    La tabla tiene dos capas:
+
+    - ``base``: QStore ordenado (normalmente el memmap de disco, solo lectura)
+    - overlay: filas tocadas en este proceso; ``_index`` mapea clave -> slot
+      dentro de ``_values`` (n_slots, n_actions), que crece por duplicación
+
+    Los estados que no aparecen en ninguna capa valen 0.0 en todas las acciones.
+    """
+
+    __slots__ = ("n_actions", "base", "_index", "_keys", "_values")
+
+    # ------------------------------------------------------
+    def __init__(self, base: QStore | None = None, n_actions: int = 7, capacity: int = 1024):
+        self.n_actions = n_actions
+        self.base = base if base is not None else QStore.empty(n_actions)
+        self._index = {}
+        self._keys = np.zeros(capacity, dtype=np.uint64)
+        self._values = np.zeros((capacity, n_actions), dtype=np.float32)
+
+    @classmethod
+    def load(cls, path: str, n_actions: int = 7) -> "QTable":
+        if not os.path.exists(path):
+            return cls(n_actions=n_actions)
+        return cls(QStore.open(path), n_actions)
+
+    # ------------------------------------------------------
+    def __len__(self) -> int:
+        """Número de estados distintos (base + overlay)."""
+        if not self._index:
+            return len(self.base)
+        new = self.base.find_many(self._keys[:len(self._index)]) < 0
+        return len(self.base) + int(new.sum())
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._index or key in self.base
+
+    # ------------------------------------------------------
+    def _slot(self, key: int) -> int:
+        """Slot del overlay para ``key`` (se crea copiando la fila base)."""
+        slot = self._index.get(key)
+        if slot is not None:
+            return slot
+
+        slot = len(self._index)
+        if slot == len(self._keys):
+            self._grow()
+        self._index[key] = slot
+        self._keys[slot] = key
+
+        base_row = self.base.get(key)
+        self._values[slot] = 0.0 if base_row is None else base_row
+        return slot
+
+    def _grow(self):
+        cap = 2 * len(self._keys)
+        keys = np.zeros(cap, dtype=np.uint64)
+        values = np.zeros((cap, self.n_actions), dtype=np.float32)
+        keys[:len(self._keys)] = self._keys
+        values[:len(self._values)] = self._values
+        self._keys, self._values = keys, values
+
+    # ------------------------------------------------------
+    def row(self, key: int) -> np.ndarray:
+        """Valores (n_actions,) de un estado. No modificar: puede ser el memmap."""
+        slot = self._index.get(key)
+        if slot is not None:
+            return self._values[slot]
+        base_row = self.base.get(key)
+        if base_row is None:
+            return np.zeros(self.n_actions, dtype=np.float32)
+        return base_row
+
+    def lookup_many(self, keys: np.ndarray) -> np.ndarray:
+        """Filas (n, n_actions) de varios estados a la vez."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        out = np.zeros((len(keys), self.n_actions), dtype=np.float32)
+
+        idx = self.base.find_many(keys)
+        hit = idx >= 0
+        out[hit] = self.base.values[idx[hit]]
+
+        if self._index:
+            get = self._index.get
+            slots = np.fromiter((get(int(k), -1) for k in keys), dtype=np.intp, count=len(keys))
+            mine = slots >= 0
+            out[mine] = self._values[slots[mine]]
+        return out
+
+    def get(self, key: int, action: int) -> float:
+        return float(self.row(key)[action])
+
+    def set(self, key: int, action: int, value: float):
+        self._values[self._slot(key), action] = value
+
+    # ------------------------------------------------------
+    def best_action(self, state_key: int, legal_mask: np.ndarray) -> int:
+        """Acción legal de mayor Q (la primera en caso de empate), o -1 si no hay."""
+        if not legal_mask.any():
+            return -1
+        row = np.where(legal_mask, self.row(state_key), -np.inf)
+        return int(row.argmax())
+
+    def update_many(self, keys, actions, targets, alpha: float):
+        """
+        Aplica ``Q <- Q + alpha * (target - Q)`` para cada terna, en orden.
+
+        Equivale a aplicar las actualizaciones una por una, pero vectorizado:
+        para un par (s, a) que aparece n veces con objetivos t_1..t_n,
+        ``Q_n = (1 - alpha)^n Q_0 + sum_i alpha (1 - alpha)^(n - i) t_i``.
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        actions = np.asarray(actions, dtype=np.intp)
+        targets = np.asarray(targets, dtype=np.float64)
+        if len(keys) == 0:
+            return
+
+        uniq, inv = np.unique(keys, return_inverse=True)
+        slots = np.array([self._slot(int(k)) for k in uniq], dtype=np.intp)
+
+        flat = slots[inv] * self.n_actions + actions
+        order = np.argsort(flat, kind="stable")
+        flat, targets = flat[order], targets[order]
+
+        starts = np.flatnonzero(np.r_[True, flat[1:] != flat[:-1]])
+        sizes = np.diff(np.r_[starts, len(flat)])
+        pos = np.arange(len(flat)) - np.repeat(starts, sizes)
+        from_end = np.repeat(sizes, sizes) - 1 - pos
+
+        decay = 1.0 - alpha
+        weighted = alpha * decay ** from_end * targets
+        sums = np.add.reduceat(weighted, starts)
+
+        cells = flat[starts]
+        values = self._values.reshape(-1)
+        values[cells] = decay ** sizes * values[cells] + sums
+
+    # ------------------------------------------------------
+    def delta(self) -> tuple[np.ndarray, np.ndarray]:
+        """Copia de las filas tocadas en este proceso: (claves, valores)."""
+        n = len(self._index)
+        return self._keys[:n].copy(), self._values[:n].copy()
+
+    def clear_delta(self):
+        self._index.clear()
+
+    def to_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Tabla completa (base + overlay) como (claves ordenadas, valores)."""
+        return _overwrite(self.base, *self.delta())
+
+    def replace_rows(self, keys: np.ndarray, values: np.ndarray):
+        """Sobrescribe filas completas (vectorizado) y las deja en la base."""
+        merged = _overwrite(QStore(*self.to_arrays()), keys, values)
+        self.clear_delta()
+        self.base = QStore(*merged)
+
+    def save(self, path: str):
+        keys, values = self.to_arrays()
+        QStore.write(path, keys, values)
+
+
+# ------------------------------------------------------
+def _overwrite(base: QStore, keys: np.ndarray, values: np.ndarray):
+    """Unión ordenada de ``base`` y las filas dadas (las filas dadas ganan)."""
+    keys = np.asarray(keys, dtype=np.uint64)
+    all_keys, inv = np.unique(np.concatenate([base.keys, keys]), return_inverse=True)
+    out = np.zeros((len(all_keys), base.values.shape[1]), dtype=np.float32)
+    out[inv[:len(base)]] = base.values
+    out[inv[len(base):]] = values
+    return all_keys, out
+
+
+# ------------------------------------------------------
+class QAccumulator:
+    """
+    Suma y cuenta corrientes de filas Q, para promediar deltas en streaming.
+
+    Las claves se mantienen ordenadas; ``add`` suma en su sitio si todas las
+    claves ya existen y si no, reconstruye la unión una sola vez. La memoria
+    máxima es la del acumulador más el delta que se está sumando.
+    """
+
+    __slots__ = ("keys", "sums", "counts")
+
+    def __init__(self, n_actions: int = 7):
+        self.keys = np.zeros(0, dtype=np.uint64)
+        self.sums = np.zeros((0, n_actions), dtype=np.float64)
+        self.counts = np.zeros(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, keys: np.ndarray, values: np.ndarray, weight: float = 1.0):
+        """Suma un delta (claves sin repetir, valores (n, n_actions)) con peso ``weight``."""
+        keys = np.asarray(keys, dtype=np.uint64)
+
+        idx = np.searchsorted(self.keys, keys)
+        found = idx < len(self.keys)
+        found[found] = self.keys[idx[found]] == keys[found]
+
+        if not found.all():
+            all_keys = np.union1d(self.keys, keys)
+            old = np.searchsorted(all_keys, self.keys)
+            sums = np.zeros((len(all_keys), self.sums.shape[1]))
+            counts = np.zeros(len(all_keys), dtype=np.float64)
+            sums[old] = self.sums
+            counts[old] = self.counts
+            self.keys, self.sums, self.counts = all_keys, sums, counts
+            idx = np.searchsorted(self.keys, keys)
+
+        self.sums[idx] += weight * np.asarray(values, dtype=np.float64)
+        self.counts[idx] += weight
+
+    def mean(self) -> tuple[np.ndarray, np.ndarray]:
+        """Promedio (ponderado) por estado como (claves ordenadas, valores float32)."""
+        return self.keys, (self.sums / self.counts[:, None]).astype(np.float32)
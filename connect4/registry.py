@@ -0,0 +1,41 @@
+from typing import Callable
+
+from connect4.policy import Policy
+
+
+class PolicyRegistry:
+    """
+    Instancias de policies reutilizables dentro de un proceso.
+
+    Cada participante ``(nombre, clase)`` se construye una sola vez y se
+    reutiliza entre partidas (``play_policies`` llama a ``mount()`` antes de
+    cada una), así que cargar la tabla Q no se repite por partida.
+
+    Con ``fresh=True`` (o ``FRESH_INSTANCE = True`` en la clase) se crea una
+    instancia nueva en cada llamada, sin guardarla.
+    """
+
+    def __init__(self):
+        self._instances: dict[str, Policy] = {}
+
+    # ------------------------------------------------------
+    def get(self, player: tuple[str, Callable[[], Policy]], fresh: bool = False) -> Policy:
+        name, cls = player
+        if fresh or getattr(cls, "FRESH_INSTANCE", False):
+            return cls()
+
+        pol = self._instances.get(name)
+        if pol is None:
+            pol = self._instances[name] = cls()
+        return pol
+
+    def instances(self) -> dict[str, Policy]:
+        """Instancias ya construidas, por nombre."""
+        return dict(self._instances)
+
+    def clear(self):
+        self._instances.clear()
+
+
+# Registro por defecto de este proceso (cada worker tiene el suyo)
+registry = PolicyRegistry()
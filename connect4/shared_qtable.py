@@ -0,0 +1,96 @@
+import numpy as np
+from multiprocessing import shared_memory
+
+from connect4.qstore import QStore
+
+
+class SharedQStore:
+    """
+    Tabla Q base (claves ordenadas + valores) publicada en memoria compartida.
+
+    El proceso padre la crea con ``create`` y reparte ``spec`` (un dict
+    pequeño y serializable) a los workers, que la abren con ``attach`` sin
+    copiar nada: ``store`` devuelve un QStore cuyos arrays apuntan al
+    segmento compartido. Los workers nunca escriben en él; sus cambios
+    quedan en el overlay de su QTable y se devuelven como delta.
+    """
+
+    # ------------------------------------------------------
+    def __init__(self, keys_shm, values_shm, count: int, n_actions: int, owner: bool):
+        self._keys_shm = keys_shm
+        self._values_shm = values_shm
+        self.count = count
+        self.n_actions = n_actions
+        self.owner = owner
+        self._unlinked = False
+
+    @classmethod
+    def create(cls, keys: np.ndarray, values: np.ndarray) -> "SharedQStore":
+        keys = np.ascontiguousarray(keys, dtype=np.uint64)
+        values = np.ascontiguousarray(values, dtype=np.float32)
+        count, n_actions = values.shape
+
+        # SharedMemory no admite tamaño 0
+        keys_shm = shared_memory.SharedMemory(create=True, size=max(1, keys.nbytes))
+        values_shm = shared_memory.SharedMemory(create=True, size=max(1, values.nbytes))
+
+        shared = cls(keys_shm, values_shm, count, n_actions, owner=True)
+        k, v = shared._arrays()
+        k[:] = keys
+        v[:] = values
+        return shared
+
+    @classmethod
+    def attach(cls, spec: dict) -> "SharedQStore":
+        keys_shm = _attach(spec["keys"])
+        values_shm = _attach(spec["values"])
+        return cls(keys_shm, values_shm, spec["count"], spec["n_actions"], owner=False)
+
+    def spec(self) -> dict:
+        return {
+            "keys": self._keys_shm.name,
+            "values": self._values_shm.name,
+            "count": self.count,
+            "n_actions": self.n_actions,
+        }
+
+    # ------------------------------------------------------
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        # frombuffer retiene el buffer: close() falla mientras haya arrays vivos
+        keys = np.frombuffer(self._keys_shm.buf, dtype=np.uint64, count=self.count)
+        values = np.frombuffer(self._values_shm.buf, dtype=np.float32,
+                               count=self.count * self.n_actions)
+        return keys, values.reshape(self.count, self.n_actions)
+
+    def store(self) -> QStore:
+        """QStore de solo lectura sobre el segmento compartido (sin copias)."""
+        keys, values = self._arrays()
+        keys.flags.writeable = False
+        values.flags.writeable = False
+        return QStore(keys, values)
+
+    # ------------------------------------------------------
+    def close(self):
+        """
+        Cierra el segmento (y lo borra si este proceso lo creó).
+
+        Antes hay que soltar los QStore de ``store()`` (p.ej. cambiando la
+        QTable que los usa): si queda alguno vivo se lanza BufferError en vez
+        de dejar arrays apuntando a memoria ya liberada.
+        """
+        if self.owner and not self._unlinked:
+            for shm in (self._keys_shm, self._values_shm):
+                shm.unlink()
+            self._unlinked = True
+        for shm in (self._keys_shm, self._values_shm):
+            shm.close()
+
+
+# ------------------------------------------------------
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: los workers comparten el resource_tracker del padre,
+        # registrar el mismo nombre otra vez no tiene efecto
+        return shared_memory.SharedMemory(name=name)
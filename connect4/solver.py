@@ -0,0 +1,173 @@
+from connect4.bitboard_state import BOTTOM, COLUMN, TOP, BitboardConnectState, is_winning_move
+
+
+ROWS = BitboardConnectState.ROWS
+COLS = BitboardConnectState.COLS
+H1 = BitboardConnectState.H1
+CELLS = ROWS * COLS
+
+CENTER_FIRST = [3, 2, 4, 1, 5, 0, 6]
+
+BOTTOM_MASK = sum(BOTTOM)
+BOARD_MASK = sum(COLUMN)
+
+
+class Solver:
+    """
+    Solver exacto de Connect 4 (negamax alfa-beta con ventana nula).
+
+    Recibe un ConnectState (o BitboardConnectState) y trabaja internamente
+    sobre bitboards. La puntuación sigue la convención habitual:
+
+    - 0: empate con juego perfecto
+    - > 0: gana el jugador con el turno; vale (43 - jugadas al ganar) // 2,
+      es decir, cuanto antes gana mayor es el valor
+    - < 0: pierde el jugador con el turno
+
+    La tabla de transposición (2**tt_bits entradas) guarda cotas superiores
+    y se conserva entre llamadas.
+    """
+
+    def __init__(self, tt_bits: int = 20):
+        self.tt_mask = (1 << tt_bits) - 1
+        self.tt_keys = [-1] * (1 << tt_bits)  # -1: vacía (la clave 0 es el tablero vacío)
+        self.tt_values = [0] * (1 << tt_bits)
+        self.nodes = 0
+
+    # ------------------------------------------------------
+    def solve(self, state) -> int:
+        """Puntuación exacta del estado para el jugador con el turno."""
+        position, mask, moves = _bits(state)
+        return self._solve(position, mask, moves)
+
+    def best_move(self, state) -> tuple[int, int]:
+        """(columna, puntuación) de la mejor jugada; el centro gana los empates."""
+        position, mask, moves = _bits(state)
+
+        best_col, best_score = -1, -CELLS
+        for col in CENTER_FIRST:
+            if mask & TOP[col]:
+                continue
+            if is_winning_move(position, mask, col):
+                return col, (CELLS + 1 - moves) // 2
+            new_mask = mask | (mask + BOTTOM[col])
+            score = -self._solve(position ^ mask, new_mask, moves + 1)
+            if score > best_score:
+                best_col, best_score = col, score
+        return best_col, best_score
+
+    # ------------------------------------------------------
+    def _solve(self, position, mask, moves) -> int:
+        if moves == CELLS:
+            return 0
+        if _can_win_next(position, mask):
+            return (CELLS + 1 - moves) // 2
+
+        # Búsqueda con ventana nula, estrechando [lo, hi] hasta el valor exacto
+        lo = -((CELLS - moves) // 2)
+        hi = (CELLS + 1 - moves) // 2
+        while lo < hi:
+            mid = lo + (hi - lo) // 2
+            if mid <= 0 and int(lo / 2) < mid:
+                mid = int(lo / 2)
+            elif mid >= 0 and int(hi / 2) > mid:
+                mid = int(hi / 2)
+            r = self._negamax(position, mask, moves, mid, mid + 1)
+            if r <= mid:
+                hi = r
+            else:
+                lo = r
+        return lo
+
+    def _negamax(self, position, mask, moves, alpha, beta) -> int:
+        """Alfa-beta; supone que el jugador con el turno no gana en una jugada."""
+        self.nodes += 1
+
+        candidates = _non_losing_moves(position, mask)
+        if not candidates:
+            return -((CELLS - moves) // 2)
+        if moves >= CELLS - 2:
+            return 0
+
+        # Cota inferior: el rival no puede ganar en su próxima jugada
+        lower = -((CELLS - 2 - moves) // 2)
+        if alpha < lower:
+            alpha = lower
+            if alpha >= beta:
+                return alpha
+
+        # Cota superior: no se puede ganar antes de la próxima jugada propia
+        upper = (CELLS - 1 - moves) // 2
+        key = position + mask
+        slot = key & self.tt_mask
+        if self.tt_keys[slot] == key:
+            upper = self.tt_values[slot]
+        if beta > upper:
+            beta = upper
+            if alpha >= beta:
+                return beta
+
+        # Ordenar: primero las jugadas que crean más amenazas (centro en empates)
+        ordered = []
+        for col in CENTER_FIRST:
+            move = candidates & COLUMN[col]
+            if move:
+                threats = _winning_positions(position | move, mask).bit_count()
+                ordered.append((-threats, len(ordered), move))
+        ordered.sort()
+
+        for _, _, move in ordered:
+            score = -self._negamax(position ^ mask, mask | move, moves + 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        self.tt_keys[slot] = key
+        self.tt_values[slot] = alpha
+        return alpha
+
+
+# ------------------------------------------------------
+def _bits(state) -> tuple[int, int, int]:
+    if not isinstance(state, BitboardConnectState):
+        state = BitboardConnectState(state.board, state.player)
+    return state.position, state.mask, CELLS - state.empty_count
+
+
+def _can_win_next(position: int, mask: int) -> bool:
+    return any(
+        not mask & TOP[col] and is_winning_move(position, mask, col)
+        for col in range(COLS)
+    )
+
+
+def _winning_positions(position: int, mask: int) -> int:
+    """Celdas vacías que completarían un 4 en línea para ``position``."""
+    p = position
+    r = (p << 1) & (p << 2) & (p << 3)  # vertical
+
+    for shift in (H1, H1 - 1, H1 + 1):  # horizontal y diagonales
+        t = (p << shift) & (p << 2 * shift)
+        r |= t & (p << 3 * shift)
+        r |= t & (p >> shift)
+        t = (p >> shift) & (p >> 2 * shift)
+        r |= t & (p << shift)
+        r |= t & (p >> 3 * shift)
+
+    return r & (BOARD_MASK ^ mask)
+
+
+def _non_losing_moves(position: int, mask: int) -> int:
+    """Bits de las jugadas que no dejan ganar al rival en la jugada siguiente."""
+    possible = (mask + BOTTOM_MASK) & BOARD_MASK
+    opponent_win = _winning_positions(position ^ mask, mask)
+
+    forced = possible & opponent_win
+    if forced:
+        if forced & (forced - 1):
+            return 0  # dos amenazas a la vez: no se pueden tapar ambas
+        possible = forced
+
+    # No jugar justo debajo de una casilla ganadora del rival
+    return possible & ~(opponent_win >> 1)
@@ -0,0 +1,66 @@
+from connect4.connect_state import ConnectState, zobrist_hash, zobrist_hash_many
+import numpy as np
+
+
+# ------------------------------------------------------
+# Simetría izquierda-derecha
+# ------------------------------------------------------
+# Una posición y su espejo comparten la misma clave canónica. Junto con la
+# clave se devuelve el remapeo de columnas ``cols``: la columna real ``c``
+# corresponde a la columna canónica ``cols[c]`` (el remapeo es su propia
+# inversa, así que también sirve para volver de canónica a real).
+
+IDENTITY = tuple(range(ConnectState.COLS))
+MIRROR = IDENTITY[::-1]
+
+
+def mirror_board(board: np.ndarray) -> np.ndarray:
+    return board[..., ::-1]
+
+
+def _pick(key: int, mirror_key: int) -> tuple[int, tuple]:
+    if key <= mirror_key:
+        return key, IDENTITY
+    return mirror_key, MIRROR
+
+
+# ------------------------------------------------------
+def canonical_key(board: np.ndarray, normalize: bool = False) -> tuple[int, tuple]:
+    """
+    Clave canónica (Zobrist de 64 bits) de un tablero numpy.
+
+    normalize=True invierte antes los colores si hay más fichas -1 que +1
+    (la normalización de Group B), igual que ConnectState.key(normalize=True).
+    """
+    if normalize and board.sum(dtype=np.int16) < 0:
+        board = -board
+    return _pick(zobrist_hash(board), zobrist_hash(mirror_board(board)))
+
+
+def canonical_keys(boards: np.ndarray, normalize: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    canonical_key para N tableros (N, 6, 7) a la vez.
+
+    Devuelve (claves uint64 (N,), espejado bool (N,)); en las filas espejadas
+    el remapeo de columnas es MIRROR y si no IDENTITY.
+    """
+    if normalize:
+        flip = boards.sum(axis=(1, 2), dtype=np.int16) < 0
+        boards = np.where(flip[:, None, None], -boards, boards)
+    keys = zobrist_hash_many(boards)
+    mirror_keys = zobrist_hash_many(mirror_board(boards))
+    mirrored = mirror_keys < keys
+    return np.where(mirrored, mirror_keys, keys), mirrored
+
+
+def canonical_state_key(state, normalize: bool = False) -> tuple[int, tuple]:
+    """Clave canónica de un ConnectState (O(1)) o de un BitboardConnectState."""
+    if isinstance(state, ConnectState):
+        return _pick(state.key(normalize), state.mirror_key(normalize))
+    return canonical_key(state.to_board(), normalize)
+
+
+def canonical_key_from_hex(hex_state: str) -> tuple[int, tuple]:
+    """Clave canónica desde el formato hexadecimal antiguo de qvalues.json."""
+    board = np.frombuffer(bytes.fromhex(hex_state), dtype=np.int8)
+    return canonical_key(board.reshape(ConnectState.ROWS, ConnectState.COLS))
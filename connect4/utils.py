@@ -1,11 +1,120 @@
 import sys
+import ast
+import json
+import os
+import time
 import pathlib
 import inspect
 import importlib
 from typing import Type
 
+MANIFEST_NAME = ".policies_manifest.json"
+
+
+class LazyClass:
+    """
+    Referencia a una clase que todavía no se ha importado.
+
+    Se comporta como la clase: llamarla crea una instancia y los atributos
+    se leen de la clase real. El módulo se importa la primera vez que se
+    usa, no al descubrirlo. Es serializable (pickle), así que puede
+    enviarse a otros procesos sin importar nada por el camino.
+    """
+
+    def __init__(self, root: str, module_name: str, class_name: str):
+        self.root = root
+        self.module_name = module_name
+        self.class_name = class_name
+        self.__name__ = self.__qualname__ = class_name
+        self._cls = None
+        self.load_seconds = None
+
+    # ------------------------------------------------------
+    def load(self) -> Type:
+        if self._cls is None:
+            if self.root not in sys.path:
+                sys.path.insert(0, self.root)
+
+            t0 = time.perf_counter()
+            try:
+                module = importlib.import_module(self.module_name)
+                cls = getattr(module, self.class_name)
+            except Exception as e:
+                dt = time.perf_counter() - t0
+                print(f"[WARN] No se pudo importar {self.module_name}.{self.class_name} "
+                      f"({dt:.3f}s): {type(e).__name__}: {e}")
+                raise ImportError(f"{self.module_name}.{self.class_name}") from e
+
+            self.load_seconds = time.perf_counter() - t0
+            self._cls = cls
+        return self._cls
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        if attr.startswith("__") or attr in ("_cls", "root", "module_name", "class_name"):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.update(_cls=None, load_seconds=None)
+        return state
+
+    def __repr__(self):
+        return f"<class '{self.module_name}.{self.class_name}' (lazy)>"
+
+
+# ------------------------------------------------------
+def _scan_file(py_file: pathlib.Path, module_name: str, base_class: Type) -> list[str]:
+    """
+    Clases del módulo que heredan de base_class.
+
+    Solo se llama al crear o actualizar la entrada del manifest. Si el archivo
+    define clases se importa: así se reconocen alias e intermedias importadas
+    de otros archivos, y un grupo roto falla aquí y no a mitad de una ejecución.
+    """
+    tree = ast.parse(py_file.read_text(encoding="utf-8"), filename=str(py_file))
+    if not any(isinstance(node, ast.ClassDef) for node in tree.body):
+        return []
+
+    module = importlib.import_module(module_name)
+    return [
+        name for name, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, base_class) and obj is not base_class
+        and obj.__module__ == module_name
+    ]
+
+
+def _load_manifest(path: pathlib.Path) -> dict:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(path: pathlib.Path, manifest: dict):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # carpeta de solo lectura: se vuelve a escanear la próxima vez
+
 
 def find_importable_classes(folder_route: str, base_class: Type) -> dict[str, Type]:
+    """
+    Descubre las subclases de ``base_class`` bajo ``folder_route``.
+
+    Los archivos nuevos o modificados se importan una vez (ver _scan_file) y
+    el resultado (módulo, mtime, clases) se guarda en
+    ``folder_route/.policies_manifest.json``: en las siguientes llamadas los
+    archivos sin cambios no se importan. Devuelve {nombre del grupo: LazyClass};
+    cada módulo se importa al usar su clase.
+    """
     candidates = {}
     folder_path = pathlib.Path(folder_route).resolve()
     project_root = folder_path.parents[0]
@@ -13,15 +122,35 @@ def find_importable_classes(folder_route: str, base_class: Type) -> dict[str, Ty
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
 
-    for py_file in folder_path.rglob("*.py"):
+    manifest_path = folder_path / MANIFEST_NAME
+    cached = _load_manifest(manifest_path).get(base_class.__name__, {})
+    entries = {}
+
+    for py_file in sorted(folder_path.rglob("*.py")):
         rel_path = py_file.relative_to(project_root).with_suffix("")
         module_name = ".".join(rel_path.parts)
-        try:
-            module = importlib.import_module(module_name)
-            for _, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, base_class) and obj is not base_class:
-                    candidates[obj.__module__.split(".")[1]] = obj
-        except Exception as _:
-            continue
+        mtime = py_file.stat().st_mtime
+
+        entry = cached.get(module_name)
+        if entry is None or entry["mtime"] != mtime:
+            t0 = time.perf_counter()
+            try:
+                classes = _scan_file(py_file, module_name, base_class)
+            except Exception as e:
+                # Sin entrada en el manifest: se vuelve a intentar la próxima vez
+                print(f"[WARN] Se omite {py_file} "
+                      f"({time.perf_counter() - t0:.3f}s): {type(e).__name__}: {e}")
+                continue
+            entry = {"mtime": mtime, "classes": classes}
+        entries[module_name] = entry
+
+        for class_name in entry["classes"]:
+            candidates[module_name.split(".")[1]] = LazyClass(str(project_root), module_name,
+                                                              class_name)
+
+    if entries != cached:
+        manifest = _load_manifest(manifest_path)
+        manifest[base_class.__name__] = entries
+        _save_manifest(manifest_path, manifest)
 
     return candidates
@@ -1,18 +1,26 @@
 import numpy as np
-import json
 import os
 import tempfile
+from connect4.experience import ExperienceBuffer
 from connect4.policy import Policy
+from connect4.qstore import QStore, convert_json
+from connect4.qtable import QTable
+from connect4.symmetry import canonical_key, canonical_keys
 from typing import override
 
 
 class UncertaintyWithEGreedy(Policy):
 
     def __init__(self):
-        self.Q = {}
+        self.Q = QTable()  # Claves enteras canónicas -> 7 valores float32
         self.memory = []
+        self.batch_memory = []  # una memoria por partida del lote (act_batch)
         self.epsilon = 0.0  # Sin exploración, solo explotación
         self.alpha = 0.2
+        self.learning = True  # False: juega sin actualizar Q (p.ej. en sprt.py)
+        # Partidas acumuladas y aplicadas a Q de golpe cada flush_every
+        # (td_lambda=None: Monte Carlo; p.ej. gamma=0.99, td_lambda=0.8: TD(lambda))
+        self.buffer = ExperienceBuffer(flush_every=16, alpha=self.alpha, gamma=1.0, td_lambda=None)
         self.rng = np.random.default_rng()
         self._load_qvalues()  # Cargar los Q-values al iniciar
 
@@ -24,117 +32,133 @@ class UncertaintyWithEGreedy(Policy):
     def act(self, s: np.ndarray) -> int:
         """Devuelve la acción que el agente tomará, según la política epsilon-greedy."""
         
-        b_real = s.copy()  # Copia del tablero real (sin normalizar)
+        b_real = s  # Tablero real (sin normalizar, no se modifica)
         b = self._normalize(b_real)  # Normalización del tablero para el aprendizaje
 
         # Acciones posibles (columnas disponibles)
-        available = np.flatnonzero(b_real[0] == 0)
-        if available.size == 0:
+        available = b_real[0] == 0
+        if not available.any():
             return -1  # Si no hay columnas disponibles, retornar -1
 
-        # CORRECCIÓN: Usar el método correcto para generar la clave
-        state_key = self._state_key_hex(b)
-
-        # Inicializar Q-values para las nuevas acciones si no existen
-        for c in available:
-            key = f"{state_key}|{int(c)}"
-            if key not in self.Q:
-                self.Q[key] = 0.0
+        # Clave canónica: el tablero y su espejo comparten entradas en Q.
+        # cols[c] es la columna canónica de la columna real c (y viceversa).
+        state_key, cols = self._state_key_canonical(b)
+        legal = available[list(cols)]
 
         # Selección de acción explotando los Q-values (sin exploración)
-        action = max(available, key=lambda c: self.Q.get(f"{state_key}|{int(c)}", 0.0))
+        c_action = self.Q.best_action(state_key, legal)
+        action = cols[c_action]
         print(f"Acción seleccionada (explotación): {action}")
 
-        # Guardar el estado y la acción en memoria para actualizar después
-        self.memory.append((state_key, action))
+        # Guardar el estado, la acción (canónica) y las jugadas legales para actualizar después
+        self.memory.append((state_key, c_action, legal))
         return action
 
     @override
     def final(self, reward: int):
-        """Actualiza los Q-values según el premio recibido y limpia la memoria."""
-        for s_key, a in self.memory:
-            key = f"{s_key}|{a}"
-            q = self.Q.get(key, 0.0)
-            self.Q[key] = q + self.alpha * (reward - q)
+        """Guarda la partida en el buffer (y actualiza Q si ya hay suficientes); limpia la memoria."""
+        if self.learning and self.memory:
+            keys, actions, legal = zip(*self.memory)
+            if self.buffer.add(keys, actions, legal, reward):
+                self.flush()
 
-        # Limpiar la memoria después de actualizar los Q-values
+        # Limpiar la memoria después de guardar la partida
         self.memory.clear()
 
+    @override
+    def mount_batch(self, n: int):
+        self.batch_memory = [[] for _ in range(n)]
+
+    @override
+    def act_batch(self, boards: np.ndarray, legal_mask: np.ndarray,
+                  rows: np.ndarray | None = None) -> np.ndarray:
+        """Como act(), pero para muchos tableros: claves y consultas a Q vectorizadas."""
+        if rows is None:
+            rows = np.arange(len(boards))
+
+        # Claves canónicas (normalizadas) y jugadas legales en orden canónico
+        keys, mirrored = canonical_keys(boards, normalize=True)
+        legal = np.where(mirrored[:, None], legal_mask[:, ::-1], legal_mask)
+
+        q = np.where(legal, self.Q.lookup_many(keys), -np.inf)
+        c_actions = q.argmax(axis=1)  # la primera en caso de empate, como best_action
+        actions = np.where(mirrored, legal_mask.shape[1] - 1 - c_actions, c_actions)
+        actions[~legal.any(axis=1)] = -1
+
+        for row, key, c_action, row_legal in zip(rows, keys, c_actions, legal):
+            self.batch_memory[row].append((int(key), int(c_action), row_legal))
+        return actions
+
+    @override
+    def final_batch(self, rewards: np.ndarray):
+        """final() de cada partida del lote, en orden."""
+        for memory, reward in zip(self.batch_memory, rewards):
+            self.memory = memory
+            self.final(int(reward))
+        self.batch_memory = []
+        self.memory = []
+
+    def flush(self):
+        """Aplica a Q las partidas pendientes del buffer."""
+        self.buffer.flush(self.Q)
+
     # Utilidades para el manejo de archivos ------------
 
     def _normalize(self, board: np.ndarray) -> np.ndarray:
         """Normaliza el tablero para asegurarse de que el agente siempre juegue como el jugador 1."""
-        b = board.copy()
-        ones = np.count_nonzero(b == 1)
-        negs = np.count_nonzero(b == -1)
-
-        # Si hay más fichas -1, invertir todo el tablero para jugar como 1
-        if negs > ones:
-            b = -b
-
-        return b
-
-    def _state_key_hex(self, board: np.ndarray) -> str:
-        """Convierte el tablero en una cadena hexadecimal compatible con el formato del JSON."""
-        flat = board.reshape(-1)
-        hex_parts = []
-        for val in flat:
-            if val == -1:
-                hex_parts.append('ff')  # -1 se representa como 'ff'
-            elif val == 0:
-                hex_parts.append('00')  # 0 se representa como '00'
-            elif val == 1:
-                hex_parts.append('01')  # 1 se representa como '01'
-            else:
-                # Para valores inesperados
-                hex_parts.append(f'{val & 0xFF:02x}')
-        
-        return ''.join(hex_parts)
+        # sum = unos - menos unos: si es negativo hay más fichas -1, invertir
+        if board.sum(dtype=np.int16) < 0:
+            return -board
+        return board
+
+    def _state_key_canonical(self, board: np.ndarray) -> tuple[int, tuple]:
+        """Clave canónica (hash de 64 bits) y remapeo de columnas del tablero."""
+        return canonical_key(board)
 
     def _state_key(self, s: np.ndarray) -> str:
         """Convierte el tablero en una cadena única para usar como clave de estado (método alternativo)."""
         return ",".join(map(str, s.reshape(-1)))
 
     def _json_path(self) -> str:
-        """Devuelve la ruta del archivo donde se guardarán los Q-values."""
+        """Devuelve la ruta del archivo JSON antiguo de Q-values (solo para convertirlo)."""
         path = os.path.join(os.path.dirname(__file__), "qvalues.json")
         return path
 
+    def _bin_path(self) -> str:
+        """Devuelve la ruta del archivo binario donde se guardarán los Q-values."""
+        path = os.path.join(os.path.dirname(__file__), "qvalues.bin")
+        return path
+
     def _load_qvalues(self):
-        """Carga los Q-values desde el archivo json, si existe."""
-        path = self._json_path()
-        if not os.path.exists(path):
-            print("No se encontró el archivo de Q-values, inicializando vacío.")
-            self.Q = {}
-            return
+        """Abre los Q-values con memmap (convirtiendo qvalues.json la primera vez)."""
+        path = self._bin_path()
         try:
-            with open(path, "r") as f:
-                text = f.read().strip()
-                if text:
-                    self.Q = json.loads(text)
-                    print(f"Q-values cargados: {len(self.Q)} estados en memoria")
-                else:
-                    print("Archivo de Q-values vacío, inicializando vacío.")
-                    self.Q = {}
+            if not os.path.exists(path):
+                if not os.path.exists(self._json_path()):
+                    print("No se encontró el archivo de Q-values, inicializando vacío.")
+                    self.Q = QTable()
+                    return
+                n = convert_json(self._json_path(), path)
+                print(f"qvalues.json convertido a {os.path.basename(path)}: {n} estados")
+
+            self.Q = QTable.load(path)
+            print(f"Q-values cargados: {len(self.Q)} estados en memoria")
         except Exception as e:
             print(f"Error al cargar los Q-values: {e}")
-            self.Q = {}
+            self.Q = QTable()
 
     def _save_qvalues(self, path_override=None):
         """Guarda los Q-values de forma segura en un archivo temporal y luego renombra."""
-        path = path_override or self._json_path()
-        tmp = path + ".tmp"
+        path = path_override or self._bin_path()
+        self.flush()
 
         try:
-            with open(tmp, "w") as f:
-                json.dump(self.Q, f)
-
-            # Intenta reemplazar el archivo original
-            os.replace(tmp, path)
-        except PermissionError:
-            print("Error de permisos, intentando de nuevo...")
-            if os.path.exists(path):
-                os.remove(path)
-            os.rename(tmp, path)
+            keys, values = self.Q.to_arrays()
+
+            # Soltar el memmap antes de reemplazar el archivo (Windows)
+            self.Q.clear_delta()
+            self.Q.base = QStore.empty()
+            QStore.write(path, keys, values)
+            self.Q.base = QStore.open(path)
         except Exception as e:
             print(f"Error al guardar los Q-values: {e}")
@@ -0,0 +1,161 @@
+import math
+import time
+import numpy as np
+from connect4.policy import Policy
+from connect4.connect_state import ConnectState
+from connect4.batch_state import BatchConnectState
+from connect4.bitboard_state import player_to_move
+from typing import override
+
+
+class _Node:
+    """Nodo del árbol. W se mide desde el punto de vista de quien movió hacia aquí."""
+
+    __slots__ = ("state", "parent", "children", "untried", "N", "W")
+
+    def __init__(self, state: ConnectState, parent=None):
+        self.state = state
+        self.parent = parent
+        self.children = {}
+        self.untried = [] if state.is_final() else state.get_free_cols()
+        self.N = 0
+        self.W = 0.0
+
+
+class MonteCarloTreeSearch(Policy):
+    """
+    MCTS (UCT) con rollouts vectorizados.
+
+    - expansión con ConnectState.transition (clone + transition_fast)
+    - cada hoja se evalúa con ``rollouts`` partidas aleatorias jugadas a la
+      vez en un BatchConnectState, en lugar de un bucle de Python por partida
+    - presupuesto: ``simulations`` iteraciones fijas, o si es None el tiempo
+      de ``mount(time_out)`` en segundos (DEFAULT_TIME_OUT si no se indica)
+    - el subárbol de la jugada elegida y de la respuesta del rival se
+      reutiliza en el siguiente ``act``
+    """
+
+    DEFAULT_TIME_OUT = 0.1
+
+    def __init__(self, simulations: int | None = None, rollouts: int = 32,
+                 c: float = 1.4, seed: int | None = None):
+        self.simulations = simulations
+        self.rollouts = rollouts
+        self.c = c
+        self.rng = np.random.default_rng(seed)
+        self.time_out = self.DEFAULT_TIME_OUT
+        self.root = None
+        self.roots = []  # raíz de cada partida del lote (act_batch)
+        self.batch = BatchConnectState(rollouts, auto_reset=False)
+
+    @override
+    def mount(self, time_out=None):
+        self.time_out = self.DEFAULT_TIME_OUT if time_out is None else float(time_out)
+        self.root = None
+
+    def final(self, reward: int):
+        self.root = None
+
+    # Lotes: un árbol por partida, para no perder la reutilización de subárboles
+    @override
+    def mount_batch(self, n: int):
+        self.mount()
+        self.roots = [None] * n
+
+    @override
+    def act_batch(self, boards: np.ndarray, legal_mask: np.ndarray,
+                  rows: np.ndarray | None = None) -> np.ndarray:
+        if rows is None:
+            rows = np.arange(len(boards))
+        actions = np.empty(len(boards), dtype=np.int64)
+        for i, (row, board) in enumerate(zip(rows, boards)):
+            self.root = self.roots[row]
+            actions[i] = self.act(board)
+            self.roots[row] = self.root
+        self.root = None
+        return actions
+
+    @override
+    def final_batch(self, rewards: np.ndarray):
+        self.roots = []
+        self.root = None
+
+    # ------------------------------------------------------
+    @override
+    def act(self, s: np.ndarray) -> int:
+        root = self._find_root(s)
+        if root.state.is_final() or not (root.untried or root.children):
+            return -1
+
+        deadline = time.perf_counter() + self.time_out
+        done = 0
+        while True:
+            if self.simulations is not None:
+                if done >= self.simulations:
+                    break
+            elif done and time.perf_counter() > deadline:
+                break
+            self._iterate(root)
+            done += 1
+
+        # Jugada más visitada; su subárbol queda como raíz
+        col, child = max(root.children.items(), key=lambda kv: kv[1].N)
+        child.parent = None
+        self.root = child
+        return col
+
+    # ------------------------------------------------------
+    def _find_root(self, s: np.ndarray) -> _Node:
+        """Reutiliza el hijo del árbol anterior que coincide con el tablero."""
+        state = ConnectState(s, player_to_move(s))
+        if self.root is not None:
+            key = state.key()
+            for child in self.root.children.values():
+                if child.state.key() == key:
+                    child.parent = None
+                    return child
+        return _Node(state)
+
+    def _iterate(self, root: _Node):
+        # Selección
+        node = root
+        while not node.untried and node.children:
+            node = self._select(node)
+
+        # Expansión
+        if node.untried:
+            col = node.untried.pop(int(self.rng.integers(len(node.untried))))
+            child = _Node(node.state.transition(col), node)
+            node.children[col] = child
+            node = child
+
+        # Evaluación (desde el punto de vista de quien movió hacia la hoja)
+        value = self._evaluate(node.state)
+
+        # Retropropagación
+        while node is not None:
+            node.N += 1
+            node.W += value
+            value = -value
+            node = node.parent
+
+    def _select(self, node: _Node) -> _Node:
+        log_n = math.log(node.N)
+        best, best_score = None, -math.inf
+        for child in node.children.values():
+            score = child.W / child.N + self.c * math.sqrt(log_n / child.N)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _evaluate(self, state: ConnectState) -> float:
+        mover = -state.player
+        if state.is_final():
+            return float(state.get_winner() * mover)
+
+        # Rollouts aleatorios en lote desde la misma hoja
+        batch = self.batch
+        batch.set_boards(state.board, state.player)
+        while not batch.is_final().all():
+            batch.step(batch.sample_actions(self.rng))
+        return float(np.mean(batch.winner * mover))
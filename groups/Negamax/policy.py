@@ -0,0 +1,182 @@
+import time
+import numpy as np
+from connect4.policy import Policy
+from connect4.bitboard_state import (
+    BOTTOM, COLUMN, TOP, BitboardConnectState, is_winning_move, player_to_move,
+)
+from typing import override
+
+
+ROWS = BitboardConnectState.ROWS
+COLS = BitboardConnectState.COLS
+
+# Orden de exploración: del centro hacia los bordes
+CENTER_FIRST = [3, 2, 4, 1, 5, 0, 6]
+
+# Pesos de la heurística (columnas centrales valen más)
+CENTER_WEIGHTS = [(COLUMN[3], 3), (COLUMN[2] | COLUMN[4], 2), (COLUMN[1] | COLUMN[5], 1)]
+
+WIN_SCORE = 1000
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class _Timeout(Exception):
+    pass
+
+
+class NegamaxAlphaBeta(Policy):
+    """
+    Negamax con poda alfa-beta y profundización iterativa sobre bitboards.
+
+    - orden de jugadas: la mejor de la tabla de transposición, luego centro primero
+    - tabla de transposición de tamaño fijo (2**TT_BITS entradas) indexada
+      por la clave única del bitboard (position + mask)
+    - respeta ``mount(time_out)`` (segundos por jugada) y guarda en
+      ``self.stats`` los nodos visitados y los nodos/segundo de la última jugada
+    """
+
+    TT_BITS = 20
+    DEFAULT_TIME_OUT = 0.1
+
+    def __init__(self, max_depth: int = ROWS * COLS, verbose: bool = False):
+        self.max_depth = max_depth
+        self.verbose = verbose
+        self.time_out = self.DEFAULT_TIME_OUT
+        self.tt = [None] * (1 << self.TT_BITS)
+        self.tt_mask = (1 << self.TT_BITS) - 1
+        self.nodes = 0
+        self.deadline = 0.0
+        self.stats = {}
+
+    @override
+    def mount(self, time_out=None):
+        self.time_out = self.DEFAULT_TIME_OUT if time_out is None else float(time_out)
+
+    def final(self, reward: int):
+        pass
+
+    # ------------------------------------------------------
+    @override
+    def act(self, s: np.ndarray) -> int:
+        """Mejor columna encontrada dentro del tiempo disponible."""
+        state = BitboardConnectState.from_board(s, player_to_move(s))
+        position, mask = state.position, state.mask
+        moves = ROWS * COLS - state.empty_count
+
+        legal = [c for c in CENTER_FIRST if not mask & TOP[c]]
+        if not legal:
+            return -1
+
+        t0 = time.perf_counter()
+        self.deadline = t0 + self.time_out
+        self.nodes = 0
+
+        best, depth_done = legal[0], 0
+        for depth in range(1, min(self.max_depth, state.empty_count) + 1):
+            try:
+                score, move = self._root(position, mask, moves, depth, legal)
+            except _Timeout:
+                break
+            best, depth_done = move, depth
+            if abs(score) >= WIN_SCORE:
+                break  # resultado forzado: no hace falta ir más hondo
+
+        elapsed = time.perf_counter() - t0
+        self.stats = {
+            "nodes": self.nodes,
+            "depth": depth_done,
+            "seconds": elapsed,
+            "nps": self.nodes / elapsed if elapsed > 0 else 0.0,
+        }
+        if self.verbose:
+            print(f"[Negamax] col={best} depth={depth_done} "
+                  f"nodes={self.nodes} nps={self.stats['nps']:.0f}")
+        return best
+
+    # ------------------------------------------------------
+    def _root(self, position, mask, moves, depth, legal):
+        # Intentar primero la mejor jugada de la iteración anterior
+        entry = self.tt[(position + mask) & self.tt_mask]
+        if entry is not None and entry[0] == position + mask and entry[4] in legal:
+            legal = [entry[4]] + [c for c in legal if c != entry[4]]
+
+        alpha, beta = -WIN_SCORE * 2, WIN_SCORE * 2
+        best_move = legal[0]
+        for col in legal:
+            if is_winning_move(position, mask, col):
+                return WIN_SCORE + (ROWS * COLS - moves), col
+
+            new_mask = mask | (mask + BOTTOM[col])
+            score = -self._negamax(position ^ mask, new_mask, moves + 1, depth - 1, -beta, -alpha)
+            if score > alpha:
+                alpha, best_move = score, col
+
+        self._store(position + mask, depth, EXACT, alpha, best_move)
+        return alpha, best_move
+
+    def _negamax(self, position, mask, moves, depth, alpha, beta):
+        self.nodes += 1
+        if not self.nodes & 1023 and time.perf_counter() > self.deadline:
+            raise _Timeout()
+
+        if moves == ROWS * COLS:
+            return 0
+
+        # Victoria inmediata
+        for col in CENTER_FIRST:
+            if not mask & TOP[col] and is_winning_move(position, mask, col):
+                return WIN_SCORE + (ROWS * COLS - moves)
+
+        if depth == 0:
+            return _evaluate(position, mask)
+
+        key = position + mask
+        alpha0 = alpha
+        first = None
+        entry = self.tt[key & self.tt_mask]
+        if entry is not None and entry[0] == key:
+            _, e_depth, flag, value, first = entry
+            if e_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        order = CENTER_FIRST if first is None else [first] + [c for c in CENTER_FIRST if c != first]
+
+        best, best_move = -WIN_SCORE * 2, None
+        for col in order:
+            if mask & TOP[col]:
+                continue
+            new_mask = mask | (mask + BOTTOM[col])
+            score = -self._negamax(position ^ mask, new_mask, moves + 1, depth - 1, -beta, -alpha)
+            if score > best:
+                best, best_move = score, col
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        flag = UPPER if best <= alpha0 else LOWER if best >= beta else EXACT
+        self._store(key, depth, flag, best, best_move)
+        return best
+
+    def _store(self, key, depth, flag, value, move):
+        self.tt[key & self.tt_mask] = (key, depth, flag, value, move)
+
+
+# ------------------------------------------------------
+# Utilidades de bitboard
+# ------------------------------------------------------
+
+def _evaluate(position: int, mask: int) -> int:
+    """Heurística simple: control del centro (siempre |valor| < WIN_SCORE)."""
+    other = position ^ mask
+    score = 0
+    for cols, weight in CENTER_WEIGHTS:
+        score += weight * ((position & cols).bit_count() - (other & cols).bit_count())
+    return score
@@ -0,0 +1,13 @@
+from connect4.book import BookPolicy
+from groups.Negamax.policy import NegamaxAlphaBeta
+
+
+class NegamaxWithBook(BookPolicy):
+    """
+    Negamax con libro de aperturas: juega desde ``opening_book.bin`` (ver
+    build_book.py) mientras la posición esté en el libro y, fuera de él (o
+    si aún no se ha generado), busca con NegamaxAlphaBeta.
+    """
+
+    def __init__(self, path: str | None = None):
+        super().__init__(NegamaxAlphaBeta(), path)
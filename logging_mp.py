@@ -1,20 +1,180 @@
+import atexit
 import json
+import multiprocessing
+import multiprocessing.util
 import os
+import queue
+import threading
+import time
 from multiprocessing import Lock
 
+from connect4.columnar import ColumnarSink
+
 os.makedirs("training_logs", exist_ok=True)
 
 _log_lock = Lock()
 
+# ------------------------------------------------------------
+# Escritura asíncrona
+# ------------------------------------------------------------
+# Los workers NO abren archivos: acumulan registros en una lista local y la
+# mandan entera a una cola cada LOCAL_BATCH registros (o cada LOCAL_SECONDS).
+# Un único proceso escritor vacía la cola y escribe por lotes.
+
+LOG_DIR = "training_logs"
+LOCAL_BATCH = 64
+LOCAL_SECONDS = 0.5
+
+_queue = None  # cola hacia el escritor (None: escritura directa, como antes)
+_writer = None  # proceso escritor (solo en el proceso que llamó a start_logging)
+_pending = []
+_last_put = 0.0
+
+
+def start_logging(batch_size=1000, flush_seconds=1.0, columnar=False, directory=LOG_DIR):
+    """
+    Arranca el proceso escritor y devuelve su cola.
+
+    El escritor guarda cada flujo ("champions", "matches", ...) en
+    ``directory/<flujo>.jsonl`` y, con ``columnar=True``, también por columnas
+    en ``directory/<flujo>/`` (ver connect4.columnar). Escribe cuando junta
+    ``batch_size`` registros o pasan ``flush_seconds`` segundos.
+
+    Los workers de un Pool deben recibir la cola con ``init_worker_logging``
+    (initializer), también con fork: además registra el envío de lo pendiente
+    al salir.
+    """
+    global _queue, _writer
+    # SimpleQueue: put() escribe en el pipe en el acto (sin hilo alimentador que
+    # se pierda si el Pool termina al worker justo después)
+    _queue = multiprocessing.SimpleQueue()
+    _writer = multiprocessing.Process(
+        target=_writer_loop,
+        args=(_queue, batch_size, flush_seconds, columnar, directory),
+        daemon=True,
+    )
+    _writer.start()
+    return _queue
+
+
+def init_worker_logging(log_queue):
+    """
+    Initializer de los workers: usar la cola del escritor.
+
+    Lo pendiente se envía al terminar el worker (pool.close() + join()); los
+    workers salen con os._exit, así que atexit no sirve. Con pool.terminate()
+    no hay aviso: cada trabajo debe llamar a flush_logs() antes de volver.
+    """
+    global _queue
+    _queue = log_queue
+    multiprocessing.util.Finalize(None, flush_logs, exitpriority=10)
+
+
+def flush_logs():
+    """Manda a la cola lo acumulado en este proceso (llamar al terminar un trabajo)."""
+    global _pending, _last_put
+    if _queue is not None and _pending:
+        _queue.put(_pending)
+        _pending = []
+    _last_put = time.monotonic()
+
+
+def stop_logging():
+    """Vacía lo pendiente y espera a que el escritor termine."""
+    global _queue, _writer
+    flush_logs()
+    if _writer is not None:
+        _queue.put(None)
+        _writer.join()
+        _writer = None
+    _queue = None
+
+
+atexit.register(flush_logs)
+
+
+def _emit(stream, entry):
+    if _queue is None:
+        # Sin escritor: una línea por evento (comportamiento original)
+        with _log_lock:
+            with open(os.path.join(LOG_DIR, f"{stream}.jsonl"), "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        return
+
+    _pending.append((stream, entry))
+    if len(_pending) >= LOCAL_BATCH or time.monotonic() - _last_put >= LOCAL_SECONDS:
+        flush_logs()
+
+
+def _writer_loop(log_queue, batch_size, flush_seconds, columnar, directory):
+    # Un hilo lee la cola del sistema; el bucle principal espera con timeout
+    local = queue.Queue()
+    threading.Thread(target=_forward, args=(log_queue, local), daemon=True).start()
+
+    os.makedirs(directory, exist_ok=True)
+    files = {}
+    sinks = {}
+    batches = {}
+    count = 0
+    deadline = time.monotonic() + flush_seconds
+
+    def write_all():
+        for stream, rows in batches.items():
+            if not rows:
+                continue
+            f = files.get(stream)
+            if f is None:
+                f = files[stream] = open(os.path.join(directory, f"{stream}.jsonl"), "a")
+            f.write("".join(json.dumps(row) + "\n" for row in rows))
+            f.flush()
+            if columnar:
+                sink = sinks.get(stream)
+                if sink is None:
+                    sink = sinks[stream] = ColumnarSink(os.path.join(directory, stream))
+                sink.write(rows)
+        batches.clear()
+
+    running = True
+    while running:
+        try:
+            records = local.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            records = []
+
+        if records is None:
+            running = False
+        else:
+            for stream, entry in records:
+                batches.setdefault(stream, []).append(entry)
+            count += len(records)
+
+        if not running or count >= batch_size or time.monotonic() >= deadline:
+            write_all()
+            count = 0
+            deadline = time.monotonic() + flush_seconds
+
+    for f in files.values():
+        f.close()
+
+
+def _forward(log_queue, local):
+    while True:
+        records = log_queue.get()
+        local.put(records)
+        if records is None:
+            return
+
+
+# ------------------------------------------------------------
+# API
+# ------------------------------------------------------------
 def log_champion(run_id, seed, policy_name):
     entry = {
         "run": run_id,
         "seed": seed,
         "champion": policy_name
     }
-    with _log_lock:
-        with open("training_logs/champions.jsonl", "a") as f:
-            f.write(json.dumps(entry) + "\n")
+    _emit("champions", entry)
 
 
 def log_match(run_id, seed, winner):
@@ -23,6 +183,4 @@ def log_match(run_id, seed, winner):
         "seed": seed,
         "winner": winner
     }
-    with _log_lock:
-        with open("training_logs/matches.jsonl", "a") as f:
-            f.write(json.dumps(entry) + "\n")
+    _emit("matches", entry)
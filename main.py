@@ -1,3 +1,7 @@
+import functools
+import os
+
+from connect4.archive import GameArchive
 from connect4.policy import Policy
 from connect4.utils import find_importable_classes
 from tournament import run_tournament, play
@@ -8,10 +12,12 @@ participants = find_importable_classes("groups", Policy)
 # Build a participant list (name, class)
 players = list(participants.items())
 
-# Run the tournament
-champion = run_tournament(
-    players,
-    play,  # You could also create your own play function for testing purposes
-    shuffle=True,
-)
+# Run the tournament (every game is appended to versus/games.c4a)
+os.makedirs("versus", exist_ok=True)
+with GameArchive("versus/games.c4a") as archive:
+    champion = run_tournament(
+        players,
+        functools.partial(play, archive=archive),  # You could also create your own play function for testing purposes
+        shuffle=True,
+    )
 print("Champion:", champion)
@@ -0,0 +1,122 @@
+# ==============================================================
+#          RATINGS.PY — ELO INCREMENTAL CON VENTAJA DE SALIDA
+# ==============================================================
+
+import json
+import os
+
+
+class EloRatings:
+    """
+    Ratings Elo actualizados partida a partida.
+
+    Consume las filas que ya emite ``train_mp.train_run``
+    (``player_a``, ``player_b``, ``first_player``, ``winner``) y modela la
+    ventaja de mover primero como un bonus en puntos Elo (``first_move_advantage``)
+    que también se aprende en línea. ``first_player`` es quien mueve primero
+    (el jugador -1: ConnectState empieza con -1).
+
+    Convergencia: cada ``window`` partidas se toma una foto de los ratings;
+    se considera convergido cuando ningún rating se movió más de ``tol``
+    puntos durante ``patience`` ventanas seguidas.
+    """
+
+    def __init__(self, k=16.0, initial=1500.0, first_move_advantage=0.0, fma_k=4.0,
+                 window=1000, tol=10.0, patience=3, history_path=None):
+        self.k = k
+        self.initial = initial
+        self.first_move_advantage = first_move_advantage
+        self.fma_k = fma_k
+
+        self.window = window
+        self.tol = tol
+        self.patience = patience
+        self.history_path = history_path
+
+        self.ratings = {}
+        self.games = 0
+        self._snapshot = {}
+        self._stable = 0
+
+    # ------------------------------------------------------
+    def rating(self, name) -> float:
+        return self.ratings.setdefault(name, self.initial)
+
+    def expected(self, first, second) -> float:
+        """Puntuación esperada de ``first`` (mueve primero) contra ``second``."""
+        diff = self.rating(second) - (self.rating(first) + self.first_move_advantage)
+        return 1.0 / (1.0 + 10 ** (diff / 400))
+
+    def update(self, row):
+        """Aplica el resultado de una fila de log."""
+        first = row["first_player"]
+        second = row["player_b"] if first == row["player_a"] else row["player_a"]
+
+        if row["winner"] == first:
+            score = 1.0
+        elif row["winner"] == second:
+            score = 0.0
+        else:
+            score = 0.5
+
+        surprise = score - self.expected(first, second)
+        self.ratings[first] += self.k * surprise
+        self.ratings[second] -= self.k * surprise
+        self.first_move_advantage += self.fma_k * surprise
+
+        self.games += 1
+        if self.games % self.window == 0:
+            self._close_window()
+
+    def update_many(self, rows):
+        for row in rows:
+            self.update(row)
+
+    # ------------------------------------------------------
+    def _close_window(self):
+        moved = max(
+            (abs(r - self._snapshot.get(name, self.initial)) for name, r in self.ratings.items()),
+            default=0.0,
+        )
+        self._stable = self._stable + 1 if moved < self.tol else 0
+        self._snapshot = dict(self.ratings)
+
+        if self.history_path:
+            self._append_history()
+
+    def converged(self) -> bool:
+        return self._stable >= self.patience
+
+    def _append_history(self):
+        os.makedirs(os.path.dirname(self.history_path) or ".", exist_ok=True)
+        entry = {
+            "games": self.games,
+            "first_move_advantage": self.first_move_advantage,
+            "ratings": self.ratings,
+        }
+        with open(self.history_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    # ------------------------------------------------------
+    def table(self):
+        """[(nombre, rating)] de mayor a menor."""
+        return sorted(self.ratings.items(), key=lambda kv: kv[1], reverse=True)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({
+                "games": self.games,
+                "first_move_advantage": self.first_move_advantage,
+                "ratings": self.ratings,
+            }, f, indent=2)
+
+    def load(self, path):
+        """Continúa desde unos ratings guardados con save() (si existen)."""
+        if not os.path.exists(path):
+            return
+        with open(path, "r") as f:
+            data = json.load(f)
+        self.games = data["games"]
+        self.first_move_advantage = data["first_move_advantage"]
+        self.ratings = data["ratings"]
+        self._snapshot = dict(self.ratings)
@@ -0,0 +1,196 @@
+# ============================================================
+#          SPRT.PY — DUELO CON PARADA SECUENCIAL (SPRT)
+# ============================================================
+
+import argparse
+import functools
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from connect4.policy import Policy
+from connect4.qtable import QTable
+from connect4.utils import find_importable_classes
+from tournament import play_pair
+
+
+# ============================================================
+# Estadística
+# ============================================================
+def elo_to_score(elo):
+    """Puntuación esperada (0..1) para una diferencia de ``elo`` puntos."""
+    return 1.0 / (1.0 + 10 ** (-elo / 400))
+
+
+# Partida ficticia que se suma a los resultados (1/4 victoria, 1/2 empate,
+# 1/4 derrota): la varianza nunca es 0, ni siquiera si new gana siempre
+PRIOR = (0.25, 0.5, 0.25)
+
+
+def llr(wins, draws, losses, elo0, elo1):
+    """
+    Log-likelihood ratio (GSPRT trinomial, aproximación normal) de
+    H1: diferencia = elo1 frente a H0: diferencia = elo0.
+    """
+    if wins + draws + losses == 0:
+        return 0.0
+
+    wins, draws, losses = wins + PRIOR[0], draws + PRIOR[1], losses + PRIOR[2]
+    n = wins + draws + losses
+    x = (wins + 0.5 * draws) / n
+    var = (wins * (1 - x) ** 2 + draws * (0.5 - x) ** 2 + losses * x ** 2) / n
+
+    s0, s1 = elo_to_score(elo0), elo_to_score(elo1)
+    return n * (s1 - s0) * (2 * x - s0 - s1) / (2 * var)
+
+
+def llr_bounds(alpha, beta):
+    """(cota inferior -> acepta H0, cota superior -> acepta H1)."""
+    return math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+
+
+# ============================================================
+# Duelo secuencial en paralelo
+# ============================================================
+def run_sprt(new, old, elo0=0.0, elo1=10.0, alpha=0.05, beta=0.05,
+             batch=20, max_games=20000, workers=None, verbose=True,
+             opening_plies=4, seed=0):
+    """
+    Enfrenta ``new`` contra ``old`` (tuplas (nombre, clase o fábrica)) en lotes
+    de ``batch`` partidas, alternando quién empieza, y recalcula el LLR cada
+    vez que termina un lote. Se detiene en cuanto se acepta H0 o H1 o al
+    llegar a ``max_games``.
+
+    Cada partida empieza con ``opening_plies`` jugadas al azar; cada pareja
+    de lotes (new primero / old primero) usa las mismas aperturas, sacadas
+    de ``seed`` + número de pareja.
+
+    Devuelve un dict con el veredicto ("H0", "H1" o None), el LLR, las
+    cotas y (victorias, empates, derrotas) desde el punto de vista de new.
+    """
+    lower, upper = llr_bounds(alpha, beta)
+    wdl = [0, 0, 0]
+    value = 0.0
+    verdict = None
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        submitted = 0
+        pending = {}
+
+        def submit():
+            nonlocal submitted
+            index = submitted // batch
+            new_first = index % 2 == 0
+            pair = (new, old) if new_first else (old, new)
+            fut = pool.submit(play_pair, *pair, batch, seed + index // 2, opening_plies)
+            pending[fut] = new_first
+            submitted += batch
+
+        # Siempre hay ~2 lotes por worker en cola
+        while submitted < max_games and len(pending) < 2 * workers:
+            submit()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                w, d, l = fut.result()
+                if not pending.pop(fut):
+                    w, l = l, w  # old empezó: invertir el punto de vista
+                wdl[0] += int(w)
+                wdl[1] += int(d)
+                wdl[2] += int(l)
+
+            value = llr(*wdl, elo0, elo1)
+            if verbose:
+                print(f"  {sum(wdl)} partidas  V/E/D={wdl}  LLR={value:+.2f} "
+                      f"[{lower:+.2f}, {upper:+.2f}]")
+
+            if value >= upper:
+                verdict = "H1"
+            elif value <= lower:
+                verdict = "H0"
+            if verdict:
+                for fut in pending:
+                    fut.cancel()
+                break
+
+            if submitted < max_games:
+                submit()
+
+    return {
+        "verdict": verdict,
+        "llr": value,
+        "bounds": (lower, upper),
+        "wdl": tuple(wdl),
+        "games": sum(wdl),
+    }
+
+
+# ============================================================
+# Participantes
+# ============================================================
+def _frozen(cls, path=None):
+    """Instancia que no aprende durante el duelo (y, con ``path``, con esa tabla Q)."""
+    p = cls()
+    if path is not None:
+        p.Q = QTable.load(path)
+    p.learning = False
+    return p
+
+
+def make_player(group, qvalues=None, label=None):
+    """
+    (nombre, fábrica) para un grupo de ``groups/``. Con ``qvalues`` la policy
+    usa ese archivo .bin en lugar del suyo (p.ej. la tabla Q anterior).
+    La policy no aprende durante el duelo: "old" sigue siendo la de antes.
+    """
+    participants = find_importable_classes("groups", Policy)
+    if group not in participants:
+        raise ValueError(f"No existe el grupo {group!r}: {sorted(participants)}")
+
+    if qvalues is not None:
+        qvalues = os.path.abspath(qvalues)
+        if not os.path.exists(qvalues):
+            raise FileNotFoundError(f"No existe el archivo de Q-values {qvalues!r}")
+
+    factory = functools.partial(_frozen, participants[group], qvalues)
+    return label or group, factory
+
+
+# ============================================================
+# CLI
+# ============================================================
+def parse_args():
+    parser = argparse.ArgumentParser(description="Duelo A vs B con parada secuencial (SPRT).")
+    parser.add_argument("new", help="grupo candidato (p.ej. 'Group B')")
+    parser.add_argument("old", help="grupo de referencia")
+    parser.add_argument("--new-qvalues", help="qvalues.bin para el candidato")
+    parser.add_argument("--old-qvalues", help="qvalues.bin para la referencia")
+    parser.add_argument("--elo0", type=float, default=0.0)
+    parser.add_argument("--elo1", type=float, default=10.0)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--batch", type=int, default=20, help="partidas por lote")
+    parser.add_argument("--max-games", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--opening-plies", type=int, default=4,
+                        help="jugadas al azar al empezar cada partida (0-6)")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    new = make_player(args.new, args.new_qvalues, label=f"{args.new} (new)")
+    old = make_player(args.old, args.old_qvalues, label=f"{args.old} (old)")
+
+    result = run_sprt(new, old, args.elo0, args.elo1, args.alpha, args.beta,
+                      args.batch, args.max_games, args.workers,
+                      opening_plies=args.opening_plies, seed=args.seed)
+
+    verdict = {"H1": "new es mejor", "H0": "new no es mejor", None: "sin decisión"}
+    print(f"\n=== SPRT [{args.elo0}, {args.elo1}] ===")
+    print(f"{result['verdict']}: {verdict[result['verdict']]} "
+          f"tras {result['games']} partidas (V/E/D={result['wdl']}, LLR={result['llr']:+.2f})")
@@ -0,0 +1,83 @@
+# test_sprt.py
+import numpy as np
+
+from connect4.bitboard_state import BitboardConnectState, is_winning_move, player_to_move
+from connect4.policy import Policy
+from sprt import llr, llr_bounds, run_sprt
+from tournament import play_pair, play_policies, random_openings
+
+
+class Tactical(Policy):
+    """Gana si puede, si no bloquea, si no juega lo más al centro posible."""
+
+    def mount(self, time_out=None):
+        pass
+
+    def act(self, s: np.ndarray) -> int:
+        state = BitboardConnectState.from_board(s, player_to_move(s))
+        position, mask = state.position, state.mask
+        legal = [c for c in (3, 2, 4, 1, 5, 0, 6) if s[0, c] == 0]
+        for pos in (position, position ^ mask):
+            for col in legal:
+                if is_winning_move(pos, mask, col):
+                    return col
+        return legal[0]
+
+    def final(self, reward: int):
+        pass
+
+
+class LeftMost(Policy):
+    """Siempre la columna libre más a la izquierda."""
+
+    def mount(self, time_out=None):
+        pass
+
+    def act(self, s: np.ndarray) -> int:
+        return int(np.flatnonzero(s[0] == 0)[0])
+
+    def final(self, reward: int):
+        pass
+
+
+def test_llr_all_wins_crosses_upper_bound():
+    _, upper = llr_bounds(0.05, 0.05)
+    assert llr(20, 0, 0, 0.0, 10.0) >= upper
+    assert llr(0, 0, 20, 0.0, 10.0) < 0
+
+
+def test_random_openings_are_seeded():
+    a = random_openings(50, 4, np.random.default_rng(1))
+    b = random_openings(50, 4, np.random.default_rng(1))
+    assert (a == b).all()
+    assert len({tuple(row) for row in a}) > 1
+
+
+def test_openings_vary_games():
+    games = set()
+    for opening in [()] * 5 + list(random_openings(5, 4, np.random.default_rng(0))):
+        record = []
+        play_policies(LeftMost(), Tactical(), record=record, opening=opening)
+        games.add((tuple(opening), tuple(col for col, _ in record)))
+    assert len(games) == 6  # sin apertura siempre la misma partida
+
+
+def test_play_pair_counts_from_first_player():
+    new, old = ("Tactical", Tactical), ("LeftMost", LeftMost)
+    assert play_pair(new, old, 10, seed=3, opening_plies=4).tolist() == [10, 0, 0]
+
+
+def test_always_winning_candidate_accepts_h1():
+    new, old = ("Tactical", Tactical), ("LeftMost", LeftMost)
+    result = run_sprt(new, old, batch=10, max_games=400, workers=2, verbose=False)
+    assert result["verdict"] == "H1", result
+    assert result["wdl"][0] > 0.9 * result["games"], result
+
+
+if __name__ == "__main__":
+    test_llr_all_wins_crosses_upper_bound()
+    test_random_openings_are_seeded()
+    test_openings_vary_games()
+    test_play_pair_counts_from_first_player()
+    test_always_winning_candidate_accepts_h1()
+    print("OK")
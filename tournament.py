@@ -3,6 +3,12 @@
 # ==============================================================
 
 import numpy as np
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from connect4.batch_state import BatchConnectState
+from connect4.policy import has_native_batch
+from connect4.registry import registry
 
 
 # ==============================================================
@@ -37,7 +43,7 @@ def pair_next_round(winners):
 #        Versión ultra rápida de play()  — 1 partida
 # ==============================================================
 
-def play(a, b, seed=0):
+def play(a, b, seed=0, state_cls=None, fresh=False, archive=None):
     """
     Ultra-fast play function:
     - 1 single game
@@ -46,30 +52,56 @@ def play(a, b, seed=0):
     - no Versus objects
     - calls .final() for learning
     - returns (name, policy_class) of the winner, or None
+    - state_cls: motor a usar (ConnectState por defecto, o BitboardConnectState)
+    - policies reutilizadas del registro del proceso (fresh=True: instancias nuevas)
+    - archive: GameArchive opcional donde se añade la partida (jugadas y tiempos)
     """
 
-    from connect4.connect_state import ConnectState
-
     rng = np.random.default_rng(seed)
 
-    # Desempaquetar
-    a_name, a_class = a
-    b_name, b_class = b
+    # Policies (una instancia por participante y proceso)
+    a_pol = registry.get(a, fresh)
+    b_pol = registry.get(b, fresh)
+
+    record = [] if archive is not None else None
+    winner = play_policies(a_pol, b_pol, state_cls, record)
+
+    if archive is not None:
+        cols, times = zip(*record) if record else ((), ())
+        archive.append_moves(a[0], b[0], cols, winner, times)
+
+    if winner == 1:
+        return a
+    elif winner == -1:
+        return b
+    else:
+        return None
+
+
+def play_policies(a_pol, b_pol, state_cls=None, record=None, opening=()):
+    """
+    Juega 1 partida entre dos policies YA creadas (a = +1, b = -1; empieza -1).
+    Llama a mount() antes y a final() después. Devuelve el ganador (1 / -1 / 0).
+    Si ``record`` es una lista, se le añade (columna, segundos) por jugada.
+    ``opening``: columnas que se juegan antes de que muevan las policies.
+    """
 
-    # Crear policies
-    a_pol = a_class()
-    b_pol = b_class()
+    if state_cls is None:
+        from connect4.connect_state import ConnectState as state_cls
 
     # Montar
     a_pol.mount()
     b_pol.mount()
 
     # Nuevo estado
-    state = ConnectState()
+    state = state_cls()
+    for col in opening:
+        state = state.transition_fast(int(col))
 
     # Jugar hasta terminal
     while not state.is_final():
         board = state.board
+        t0 = time.perf_counter()
 
         if state.player == 1:
             act = a_pol.act(board)
@@ -78,21 +110,68 @@ def play(a, b, seed=0):
             act = b_pol.act(board)
             state = state.transition_fast(int(act))
 
+        if record is not None:
+            record.append((int(act), time.perf_counter() - t0))
+
     winner = state.get_winner()
 
     # Aprendizaje
     if winner == 1:
         a_pol.final(+1)
         b_pol.final(-1)
-        return a
     elif winner == -1:
         a_pol.final(-1)
         b_pol.final(+1)
-        return b
     else:
         a_pol.final(0)
         b_pol.final(0)
-        return None
+
+    return winner
+
+
+def play_policies_batch(a_pol, b_pol, n, openings=None):
+    """
+    Juega ``n`` partidas simultáneas entre dos policies (a = +1, b = -1; empieza -1)
+    con una sola llamada a act_batch por jugada. Devuelve (ganadores (n,), jugadas (n,)).
+    ``openings``: (n, k) columnas que se juegan en cada partida antes que las policies.
+    """
+    batch = BatchConnectState(n, auto_reset=False)
+    if openings is not None:
+        for cols in np.asarray(openings).T:
+            batch.step(cols)
+    a_pol.mount_batch(n)
+    b_pol.mount_batch(n)
+
+    while not batch.is_final().all():
+        legal = batch.legal_mask()
+        active = legal.any(axis=1)
+        actions = np.zeros(n, dtype=np.intp)
+
+        for pol, side in ((a_pol, 1), (b_pol, -1)):
+            rows = np.flatnonzero(active & (batch.player == side))
+            if len(rows):
+                actions[rows] = pol.act_batch(batch.boards[rows], legal[rows], rows)
+
+        batch.step(actions)
+
+    winners = batch.winner.astype(np.int64)
+    a_pol.final_batch(winners)
+    b_pol.final_batch(-winners)
+
+    moves = batch.ROWS * batch.COLS - batch.empty_count.astype(np.int64)
+    return winners, moves
+
+
+def batchable(*policies) -> bool:
+    """
+    Las partidas se juegan por lotes si alguna policy tiene act_batch propio,
+    las demás pueden usar el de por defecto (sin STATEFUL_GAMES) y son
+    instancias distintas (cada una guarda una memoria por partida).
+    """
+    distinct = len({id(p) for p in policies}) == len(policies)
+    native = [has_native_batch(p) for p in policies]
+    fallback_ok = all(n or not p.STATEFUL_GAMES for p, n in zip(policies, native))
+    return distinct and any(native) and fallback_ok
 
 
 # ==============================================================
@@ -128,3 +207,85 @@ def run_tournament(players, play_fn, shuffle=True, seed=0):
 
         # emparejar para la siguiente ronda
         versus = pair_next_round(winners)
+
+
+# ==============================================================
+#     Round robin paralelo (todas las parejas, ambos colores)
+# ==============================================================
+
+# Con menos de 7 jugadas nadie puede haber ganado todavía
+MAX_OPENING_PLIES = 6
+
+
+def random_openings(games, plies, rng):
+    """(games, plies) columnas legales al azar: una apertura por partida."""
+    if not 0 <= plies <= MAX_OPENING_PLIES:
+        raise ValueError(f"opening plies debe estar entre 0 y {MAX_OPENING_PLIES} (es {plies}).")
+    batch = BatchConnectState(games, auto_reset=False)
+    openings = np.zeros((games, plies), dtype=np.intp)
+    for k in range(plies):
+        openings[:, k] = batch.sample_actions(rng)
+        batch.step(openings[:, k])
+    return openings
+
+
+def play_pair(first, second, games, seed=None, opening_plies=0):
+    """
+    Juega ``games`` partidas en las que ``first`` mueve primero.
+    Devuelve (victorias, empates, derrotas) desde el punto de vista de first.
+
+    Con ``opening_plies`` cada partida empieza tras esas jugadas al azar
+    (sacadas de ``seed``): sin ellas dos policies deterministas repiten
+    siempre la misma partida. Con un número impar de jugadas de apertura
+    el siguiente en mover es ``second``.
+    """
+    first_pol = registry.get(first)
+    second_pol = registry.get(second)
+    openings = random_openings(games, opening_plies, np.random.default_rng(seed))
+
+    wdl = np.zeros(3, dtype=np.int64)
+    if batchable(first_pol, second_pol):
+        winners, _ = play_policies_batch(second_pol, first_pol, games, openings)
+        wdl += [(winners == -1).sum(), (winners == 0).sum(), (winners == 1).sum()]
+        return wdl
+
+    for opening in openings:
+        # Empieza -1: first juega con -1
+        winner = play_policies(second_pol, first_pol, opening=opening)
+        wdl[0 if winner == -1 else 2 if winner == 1 else 1] += 1
+    return wdl
+
+
+def run_round_robin(players, games_per_pair=2, workers=None):
+    """
+    Cada pareja ordenada (i, j), i != j, juega ``games_per_pair`` partidas
+    con i moviendo primero, repartidas en un ProcessPoolExecutor.
+
+    Devuelve (nombres, resultados) con resultados de forma (n, n, 3):
+    resultados[i, j] = (victorias, empates, derrotas) de i cuando empieza contra j.
+    """
+    names = [name for name, _ in players]
+    n = len(players)
+    results = np.zeros((n, n, 3), dtype=np.int64)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(play_pair, players[i], players[j], games_per_pair): (i, j)
+            for i in range(n) for j in range(n) if i != j
+        }
+        for fut in as_completed(futures):
+            i, j = futures[fut]
+            results[i, j] += fut.result()
+
+    return names, results
+
+
+def standings(names, results):
+    """Tabla de posiciones (nombre, puntos, V, E, D) con 1 / 0.5 / 0 por partida."""
+    # Partidas de i como primero + partidas de i como segundo (vistas desde j)
+    wdl = results.sum(axis=1) + results.sum(axis=0)[:, ::-1]
+    rows = [
+        (name, float(wdl[k, 0] + 0.5 * wdl[k, 1]), *map(int, wdl[k]))
+        for k, name in enumerate(names)
+    ]
+    return sorted(rows, key=lambda r: r[1], reverse=True)
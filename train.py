@@ -7,6 +7,7 @@ import numpy as np
 import os
 
 from connect4.policy import Policy
+from connect4.registry import registry
 from connect4.utils import find_importable_classes
 from tournament import make_initial_matches, pair_next_round, play as turbo_play
 
@@ -57,9 +58,10 @@ def fast_run_tournament(players, shuffle, seed):
 # Guardar Q-values de TODAS las policies después del entrenamiento
 # ============================================================
 def save_all_qvalues(players):
+    # Las mismas instancias que jugaron el entrenamiento (registro del proceso)
     for name, policy_class in players:
         try:
-            pol = policy_class()
+            pol = registry.get((name, policy_class))
             if hasattr(pol, "_save_qvalues"):
                 pol._save_qvalues()
         except Exception as e:
@@ -3,35 +3,47 @@ import multiprocessing
 import numpy as np
 import os
 import csv
+import queue
+import secrets
 import threading
+import time
 from collections import Counter
+from multiprocessing.connection import Client, Listener
 
 # Agregar un lock global para asegurar acceso sincronizado a los Q-values
 _qvalues_lock = threading.Lock()
 
 multiprocessing.freeze_support()
 
+from connect4.columnar import ColumnarSink
 from connect4.policy import Policy
 from connect4.utils import find_importable_classes
 from connect4.connect_state import ConnectState
+from connect4.qtable import QAccumulator, QTable
+from connect4.shared_qtable import SharedQStore
+from ratings import EloRatings
+from tournament import batchable, play_policies_batch
 
 
 # ------------------------------------------------------------
 # Partida entre dos policies (1 vs -1)
 # ------------------------------------------------------------
-def play_single_game(name_plus, pol_plus, name_minus, pol_minus, rng) -> tuple:
+def play_single_game(name_plus, pol_plus, name_minus, pol_minus, rng,
+                     state_cls=ConnectState) -> tuple:
     """Devuelve:
     winner (1 / -1 / 0),
     total_moves,
-    first_player (name_plus o name_minus)
+    first_player (quien movió primero: name_minus, ConnectState empieza con -1)
+
+    state_cls permite cambiar el motor (p.ej. BitboardConnectState).
     """
 
     pol_plus.mount()
     pol_minus.mount()
 
-    state = ConnectState()
+    state = state_cls()
     moves = 0
-    first_player = name_plus  # inicialmente quien usa +1
+    first_player = name_plus if state.player == 1 else name_minus
 
     while not state.is_final():
         board = state.board.copy()
@@ -91,86 +103,250 @@ def knockout_tournament(players: dict[str, Policy], rng) -> str:
 
 
 # ------------------------------------------------------------
-# Worker: ENTRENAMIENTO + LOGGING + Q-values
+# Tablas Q compartidas entre procesos
 # ------------------------------------------------------------
-def worker_train(args):
-    shuffle, seed, games_per_run, worker_id = args
-    rng = np.random.default_rng(seed)
+# En cada worker: nombre del grupo -> SharedQStore adjuntado (solo lectura)
+_shared_bases = {}
+
 
-    # cargar policies por grupo
+def publish_qtables() -> dict[str, SharedQStore]:
+    """Copia UNA vez a memoria compartida la tabla base de cada policy con QTable."""
     participants = find_importable_classes("groups", Policy)
-    player_names = list(sorted(participants.keys()))
-    players = {name: cls() for name, cls in participants.items()}
+
+    shared = {}
+    for name, cls in participants.items():
+        p = cls()
+        if isinstance(getattr(p, "Q", None), QTable):
+            shared[name] = SharedQStore.create(*p.Q.to_arrays())
+    return shared
+
+
+def _init_worker(specs):
+    """
+    Adjunta los segmentos compartidos (sin copiar) si no son los ya adjuntados
+    y cierra los que ya no se publican. Ninguna QTable debe seguir usándolos.
+    """
+    for name in list(_shared_bases):
+        if specs.get(name) != _shared_bases[name].spec():
+            _shared_bases.pop(name).close()
+
+    for name, spec in specs.items():
+        if name not in _shared_bases:
+            _shared_bases[name] = SharedQStore.attach(spec)
+
+
+# ------------------------------------------------------------
+# Policies del worker (se descubren UNA vez por proceso)
+# ------------------------------------------------------------
+_worker_participants = None
+_worker_players = {}
+
+
+def _worker_setup(specs) -> dict[str, Policy]:
+    """Adjunta las tablas de esta ejecución y devuelve las policies del worker."""
+    global _worker_participants
+
+    # Un pool persistente (modo --serve) recibe tablas nuevas en cada ejecución:
+    # soltar las vistas de las anteriores antes de cerrarlas
+    for p in _worker_players.values():
+        if isinstance(getattr(p, "Q", None), QTable):
+            p.Q = QTable()
+    _init_worker(specs)
+
+    if _worker_participants is None:
+        _worker_participants = find_importable_classes("groups", Policy)
+
+    for name, cls in _worker_participants.items():
+        p = _worker_players.get(name)
+        # Q en dict: instancia nueva por ejecución para no arrastrar lo aprendido
+        if p is None or (hasattr(p, "Q") and not isinstance(p.Q, QTable)):
+            p = _worker_players[name] = cls()
+
+        # Tabla base compartida + overlay vacío: lo aprendido en la ejecución es el delta
+        shared = _shared_bases.get(name)
+        if shared is not None:
+            p.Q = QTable(shared.store())
+
+    return _worker_players
+
+
+# ------------------------------------------------------------
+# Unidad de trabajo: UNA ejecución (ENTRENAMIENTO + KNOCKOUT)
+# ------------------------------------------------------------
+# Cada ejecución es una cadena de aprendizaje secuencial: empieza desde las
+# tablas base y sus partidas se juegan en orden en un único worker. Entre
+# workers solo se reparten ejecuciones independientes, así que el resultado
+# de una seed no depende del número de workers ni de su velocidad.
+
+# Partidas consecutivas que pueden jugarse a la vez con act_batch. Group B ya
+# aplica lo aprendido cada 16 partidas (ExperienceBuffer), así que jugar en
+# bloques de 16 no cambia cuánto se retrasa el aprendizaje.
+BLOCK_GAMES = 16
+
+
+def train_run(args):
+    """
+    Juega ``games`` partidas aleatorias y después el knockout con las
+    policies ya entrenadas. Devuelve (run_id, (campeón, Q-values tocados en
+    el entrenamiento, logs, estadísticas del worker)).
+    """
+    run_id, seed, games, specs = args
+    t0 = time.perf_counter()
+    run_seed = seed + run_id
+    rng = np.random.default_rng(run_seed)
+
+    players = _worker_setup(specs)
+    player_names = list(sorted(players.keys()))
 
     # LOG LOCAL DEL WORKER
     local_logs = []
-    local_qvalues = {}  # Acumulador de Q-values por worker
+    local_qvalues = {}  # Acumulador de Q-values por ejecución
 
-    # entrenamiento aleatorio
-    for _ in range(games_per_run):
+    # Emparejamientos de la ejecución: (a, b, quién juega con +1)
+    pairings = []
+    for _ in range(games):
         a, b = rng.choice(player_names, size=2, replace=False)
-        pa, pb = players[a], players[b]
+        # quién juega con +1 (mueve segundo)
+        pairings.append((a, b, a if rng.random() < 0.5 else b))
 
-        # quién empieza
-        if rng.random() < 0.5:
-            winner, moves, fp = play_single_game(a, pa, b, pb, rng)
-            fp_name = a
-        else:
-            winner, moves, fp = play_single_game(b, pb, a, pa, rng)
-            fp_name = b
+    results = [None] * games
+    for start in range(0, games, BLOCK_GAMES):
+        _play_block(players, pairings, results, range(start, min(start + BLOCK_GAMES, games)), rng)
+
+    for (a, b, plus), (winner, moves) in zip(pairings, results):
+        minus = b if plus == a else a
 
         # traducir ganador
         if winner == 1:
-            win_name = fp_name
+            win_name = plus
         elif winner == -1:
-            win_name = b if fp_name == a else a
+            win_name = minus
         else:
             win_name = "draw"
 
         # guardar fila
         local_logs.append({
-            "worker": worker_id,
-            "seed": seed,
+            "worker": run_id,
+            "seed": run_seed,
             "player_a": a,
             "player_b": b,
-            "first_player": fp_name,
+            "first_player": minus,  # ConnectState empieza con -1
             "winner": win_name,
             "moves": moves
         })
 
-    # Acumular Q-values del worker
+    # Acumular Q-values de la ejecución (solo las filas tocadas si es una QTable)
     for name, p in players.items():
-        if hasattr(p, "Q"):
+        if hasattr(p, "flush"):
+            p.flush()  # partidas aún en el buffer de experiencia
+        if isinstance(getattr(p, "Q", None), QTable):
+            local_qvalues[name] = p.Q.delta()
+        elif hasattr(p, "Q"):
             local_qvalues[name] = dict(p.Q)
 
-    # torneo final del worker
+    # torneo final de la ejecución (lo aprendido aquí se descarta)
     champion = knockout_tournament(players, rng)
+    for p in players.values():
+        if hasattr(p, "flush"):
+            p.flush()
 
-    return champion, local_qvalues, local_logs
+    return run_id, (champion, local_qvalues, local_logs, _run_stats(games, t0))
+
+
+def _play_block(players, pairings, results, idx, rng):
+    """Juega las partidas ``idx``: las parejas con act_batch a la vez, el resto una a una."""
+    batches = {}
+    for i in idx:
+        a, b, plus = pairings[i]
+        minus = b if plus == a else a
+        if batchable(players[plus], players[minus]):
+            batches.setdefault((plus, minus), []).append(i)
+        else:
+            winner, moves, _ = play_single_game(plus, players[plus], minus, players[minus], rng)
+            results[i] = winner, moves
+
+    for (plus, minus), rows in batches.items():
+        winners, moves = play_policies_batch(players[plus], players[minus], len(rows))
+        for i, w, m in zip(rows, winners, moves):
+            results[i] = int(w), int(m)
+
+
+def _run_stats(games, t0) -> dict:
+    return {
+        "worker": multiprocessing.current_process().name,
+        "games": games,
+        "seconds": time.perf_counter() - t0,
+    }
 
 
 # ------------------------------------------------------------
-# Fusionar Q PROMEDIO
+# Ocupación de los workers
 # ------------------------------------------------------------
-def merge_qvalues(all_q_out):
-    merged = {}
-    counts = {}
+class WorkerUsage:
+    """Ejecuciones, partidas y segundos ocupados de cada worker, para el informe final."""
+
+    def __init__(self):
+        self.busy = {}  # worker -> [ejecuciones, partidas, segundos]
+
+    def record(self, stats):
+        entry = self.busy.setdefault(stats["worker"], [0, 0, 0.0])
+        entry[0] += 1
+        entry[1] += stats["games"]
+        entry[2] += stats["seconds"]
+
+    def report(self, wall_seconds):
+        print(f"Ocupación de workers ({wall_seconds:.1f}s de reloj):")
+        for worker, (runs, games, seconds) in sorted(self.busy.items()):
+            util = 100.0 * seconds / wall_seconds if wall_seconds > 0 else 0.0
+            print(f"  {worker}: {runs} ejecuciones, {games} partidas, "
+                  f"{seconds:.1f}s ocupado ({util:.0f}%)")
 
-    for w in all_q_out:
-        for group, qdict in w.items():
-            if group not in merged:
-                merged[group] = {}
-                counts[group] = {}
 
+# ------------------------------------------------------------
+# Fusionar Q PROMEDIO (en streaming)
+# ------------------------------------------------------------
+class QMerger:
+    """
+    Promedia los Q-values de los workers a medida que llegan.
+
+    - QTable: deltas (claves, valores) -> QAccumulator vectorizado
+    - dict:   suma y cuenta por clave; el promedio se calcula en su sitio
+    """
+
+    def __init__(self):
+        self.arrays = {}
+        self.sums = {}
+        self.counts = {}
+
+    def add(self, q_out: dict, weight: float = 1.0):
+        for group, qdict in q_out.items():
+            if isinstance(qdict, tuple):
+                self.arrays.setdefault(group, QAccumulator()).add(*qdict, weight)
+                continue
+
+            sums = self.sums.setdefault(group, {})
+            counts = self.counts.setdefault(group, {})
             for key, val in qdict.items():
-                merged[group][key] = merged[group].get(key, 0.0) + val
-                counts[group][key] = counts[group].get(key, 0) + 1
+                sums[key] = sums.get(key, 0.0) + weight * val
+                counts[key] = counts.get(key, 0) + weight
 
-    final_q = {}
-    for g in merged:
-        final_q[g] = {k: merged[g][k] / counts[g][k] for k in merged[g]}
+    def result(self) -> dict:
+        final_q = {}
+        for g, sums in self.sums.items():
+            counts = self.counts[g]
+            for k in sums:
+                sums[k] /= counts[k]
+            final_q[g] = sums
+        for g, acc in self.arrays.items():
+            final_q[g] = acc.mean()
+        return final_q
 
-    return final_q
+
+def merge_qvalues(all_q_out):
+    merger = QMerger()
+    for q_out in all_q_out:
+        merger.add(q_out)
+    return merger.result()
 
 
 # ------------------------------------------------------------
@@ -183,7 +359,10 @@ def save_merged_qvalues(final_q):
         if name not in final_q:
             continue
         p = cls()
-        if hasattr(p, "Q") and hasattr(p, "_save_qvalues"):
+        if isinstance(getattr(p, "Q", None), QTable) and hasattr(p, "_save_qvalues"):
+            p.Q.replace_rows(*final_q[name])
+            p._save_qvalues()
+        elif hasattr(p, "Q") and hasattr(p, "_save_qvalues"):
             p.Q = final_q[name]
             p._save_qvalues()
 
@@ -191,65 +370,362 @@ def save_merged_qvalues(final_q):
 
 
 # ------------------------------------------------------------
-# Entrenamiento MULTICORE
+# Resultados en disco a medida que llegan
 # ------------------------------------------------------------
-def run_training_parallel(runs, shuffle, seed, games_per_run):
-    jobs = [(shuffle, seed + i, games_per_run, i) for i in range(runs)]
+# v2: first_player es quien mueve primero (-1); en training_results.csv
+# era el jugador +1, por eso las filas nuevas no se mezclan con las antiguas
+CSV_PATH = "logs/training_results_v2.csv"
+COLUMNAR_DIR = "logs/training_results_v2"
+LOG_FIELDS = ["worker", "seed", "player_a", "player_b", "first_player", "winner", "moves"]
 
-    ncpu = multiprocessing.cpu_count()
-    print(f"Usando {ncpu} núcleos para {runs} jobs…")
 
-    champions = []
-    all_q = []
-    all_logs = []
+class ResultsWriter:
+    """
+    Escribe las filas de cada ejecución en cuanto llegan: al CSV (cabecera solo
+    si el archivo es nuevo) y, opcionalmente, por columnas con ColumnarSink
+    (un trozo .npy por columna cada ``chunk_rows`` filas, abrible con memmap).
+    Si el proceso muere solo se pierden las filas aún no escritas.
+    """
 
-    with multiprocessing.Pool(ncpu) as pool:
-        for champion, q_out, logs in pool.imap_unordered(worker_train, jobs):
-            champions.append(champion)
-            all_q.append(q_out)
-            all_logs.extend(logs)
+    def __init__(self, csv_path=CSV_PATH, columnar_dir=None, chunk_rows=10000):
+        write_header = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+        self._file = open(csv_path, "a", newline="")
+        self._csv = csv.DictWriter(self._file, fieldnames=LOG_FIELDS)
+        if write_header:
+            self._csv.writeheader()
 
-    # Mezclar Q
-    final_q = merge_qvalues(all_q)
-    save_merged_qvalues(final_q)
+        self._sink = ColumnarSink(columnar_dir) if columnar_dir else None
+        self._chunk_rows = chunk_rows
+        self._buffer = []
+        self.rows = 0
+
+    def write(self, rows):
+        if not rows:
+            return
+        self._csv.writerows(rows)
+        self._file.flush()
+        self.rows += len(rows)
+
+        if self._sink is not None:
+            self._buffer.extend(rows)
+            if len(self._buffer) >= self._chunk_rows:
+                self._flush_columns()
+
+    def _flush_columns(self):
+        self._sink.write(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        if self._sink is not None and self._buffer:
+            self._flush_columns()
+        self._file.close()
 
-    # ---- GUARDAR LOGS CSV ----
+
+# ------------------------------------------------------------
+# Entrenamiento MULTICORE
+# ------------------------------------------------------------
+def run_training_parallel(runs, shuffle, seed, games_per_run, stop_when_converged=False,
+                          pool=None, workers=None, columnar=False):
+    """
+    Juega ``runs`` ejecuciones independientes de ``games_per_run`` partidas
+    (ver train_run), cada una con su knockout, repartidas entre los workers.
+
+    pool: Pool ya creado (p.ej. el del modo --serve). Si es None se crea uno
+    de ``workers`` procesos (por defecto cpu_count) y se cierra al terminar.
+    columnar: guardar también los resultados por columnas en COLUMNAR_DIR.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    print(f"Usando {workers} workers para {runs} ejecuciones de {games_per_run} partidas…")
+
+    champions = []
+    merger = QMerger()
+
+    # Ratings Elo acumulados entre ejecuciones
     os.makedirs("logs", exist_ok=True)
-    csv_path = "logs/training_results.csv"
+    results_writer = ResultsWriter(CSV_PATH, COLUMNAR_DIR if columnar else None)
+    ratings = EloRatings(history_path="logs/ratings_history.jsonl")
+    ratings.load("logs/ratings.json")
+
+    shared = publish_qtables()
+    specs = {name: s.spec() for name, s in shared.items()}
+
+    own_pool = pool is None
+    if own_pool:
+        pool = multiprocessing.Pool(workers)
+
+    usage = WorkerUsage()
+    results = queue.SimpleQueue()
+    finished = {}  # run_id -> resultado, hasta poder aplicarlo en orden
+    pending = 0
+    next_run = 0
+    next_apply = 0
+    stopping = False
+    t0 = time.perf_counter()
+
+    def fill():
+        # Como mucho ~2 ejecuciones por worker sin aplicar (en cola o en
+        # ``finished``): una ejecución lenta no deja acumular resultados
+        nonlocal pending, next_run
+        while not stopping and next_run < runs and next_run - next_apply < 2 * workers:
+            pool.apply_async(train_run, ((next_run, seed, games_per_run, specs),),
+                             callback=results.put, error_callback=results.put)
+            pending += 1
+            next_run += 1
+
+    try:
+        fill()
+
+        while pending:
+            out = results.get()
+            pending -= 1
+            if isinstance(out, BaseException):
+                raise out
+
+            run_id, result = out
+            finished[run_id] = result
+
+            # Aplicar en orden de ejecución: ratings y CSV no dependen de qué worker acabó antes
+            while next_apply in finished:
+                champion, q_out, logs, stats = finished.pop(next_apply)
+                next_apply += 1
+
+                champions.append(champion)
+                usage.record(stats)
+                merger.add(q_out)  # promedio por ejecución
+                results_writer.write(logs)
+                ratings.update_many(logs)
+
+                if stop_when_converged and not stopping and ratings.converged():
+                    print(f"Ratings estables tras {ratings.games} partidas: parada anticipada.")
+                    stopping = True  # se terminan las ejecuciones en curso y no se lanzan más
+
+            fill()
+    finally:
+        results_writer.close()
+        if own_pool:
+            pool.terminate()
+            pool.join()
+        for s in shared.values():
+            s.close()
+
+    usage.report(time.perf_counter() - t0)
+
+    # Q promediados
+    final_q = merger.result()
+    save_merged_qvalues(final_q)
 
-    write_header = not os.path.exists(csv_path)
-    with open(csv_path, "a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=all_logs[0].keys())
-        if write_header:
-            writer.writeheader()
-        writer.writerows(all_logs)
+    # ---- RATINGS ----
+    ratings.save("logs/ratings.json")
+    print(f"Ratings Elo (ventaja de salida: {ratings.first_move_advantage:+.1f}):")
+    for name, r in ratings.table():
+        print(f"  {name}: {r:.0f}")
 
+    print(f"{results_writer.rows} partidas añadidas a {CSV_PATH}")
     return champions
 
 
 # ------------------------------------------------------------
+# Modo daemon: pool persistente sobre forkserver
+# ------------------------------------------------------------
+DAEMON_ADDRESS = ("127.0.0.1", 6006)
+
+# multiprocessing.connection hace unpickle de lo que recibe: la clave es
+# aleatoria, la genera cada daemon al arrancar y solo la puede leer el usuario
+DAEMON_KEY_PATH = os.path.join(os.path.expanduser("~"), ".connect4_daemon_key")
+
+
+def daemon_authkey(create=False) -> bytes:
+    """Clave del daemon (``create=True``: genera una nueva con permisos 0600)."""
+    if not create:
+        with open(DAEMON_KEY_PATH, "rb") as f:
+            return f.read()
+
+    key = secrets.token_bytes(32)
+    tmp = f"{DAEMON_KEY_PATH}.{os.getpid()}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    os.replace(tmp, DAEMON_KEY_PATH)
+    return key
+
+# Módulos que el forkserver importa UNA vez; cada worker nace con ellos cargados
+PRELOAD_MODULES = [
+    "numpy",
+    "connect4.batch_state",
+    "connect4.columnar",
+    "connect4.connect_state",
+    "connect4.experience",
+    "connect4.policy",
+    "connect4.qstore",
+    "connect4.qtable",
+    "connect4.registry",
+    "connect4.shared_qtable",
+    "connect4.symmetry",
+    "connect4.utils",
+    "ratings",
+    "tournament",
+]
+
+# Trabajos aceptados por el daemon: clave -> (tipos válidos, valor por defecto)
+JOB_FIELDS = {
+    "seed": (int, None),
+    "runs": (int, 20),
+    "games_per_run": (int, 200),
+    "shuffle": (bool, True),
+    "stop_when_converged": (bool, False),
+    "columnar": (bool, False),
+}
+
+
+def get_forkserver_context():
+    """Contexto forkserver con los módulos (y las policies) precargados; spawn si no existe."""
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context()  # Windows
+
+    policies = [c.module_name for c in find_importable_classes("groups", Policy).values()]
+    # train_run se envía como <este módulo>.train_run: como script es __main__,
+    # que el forkserver carga desde su ruta (no una segunda copia "train_mp")
+    this = "__main__" if __name__ == "__main__" else __name__
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(PRELOAD_MODULES + policies + [this])
+    return ctx
+
+
+def parse_job(job) -> dict:
+    """Trabajo con los valores por defecto aplicados; ValueError si no es válido."""
+    if not isinstance(job, dict):
+        raise ValueError(f"el trabajo debe ser un dict, no {type(job).__name__}")
+    unknown = set(job) - set(JOB_FIELDS)
+    if unknown:
+        raise ValueError(f"claves desconocidas: {sorted(unknown)}")
+
+    parsed = {}
+    for key, (kind, default) in JOB_FIELDS.items():
+        value = job.get(key, default)
+        # bool es subclase de int: no aceptar True como número
+        if value is None or not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+            raise ValueError(f"{key!r} debe ser {kind.__name__}, no {value!r}")
+        parsed[key] = value
+    if parsed["runs"] < 0 or parsed["games_per_run"] < 0:
+        raise ValueError("runs y games_per_run no pueden ser negativos")
+    return parsed
+
+
+def serve(address=DAEMON_ADDRESS, authkey=None, workers=None):
+    """
+    Daemon de entrenamiento: mantiene un pool vivo y atiende trabajos
+    ``{"runs", "games_per_run", "seed", "shuffle", "stop_when_converged", "columnar"}``
+    uno tras otro (las conexiones esperan en la cola del Listener); un trabajo
+    mal formado (ver JOB_FIELDS) recibe una respuesta de error.
+    ``{"cmd": "shutdown"}`` lo detiene. Sin ``authkey`` se genera una nueva
+    en DAEMON_KEY_PATH.
+    """
+    authkey = authkey or daemon_authkey(create=True)
+    ctx = get_forkserver_context()
+    workers = workers or multiprocessing.cpu_count()
+    pool = ctx.Pool(workers)
+
+    print(f"Daemon de entrenamiento escuchando en {address[0]}:{address[1]} ({workers} workers)")
+    try:
+        with Listener(address, authkey=authkey) as listener:
+            while True:
+                try:
+                    conn = listener.accept()
+                except multiprocessing.AuthenticationError:
+                    print("[WARN] Conexión rechazada: clave incorrecta")
+                    continue
+
+                with conn:
+                    try:
+                        job = conn.recv()
+                    except EOFError:
+                        continue  # conexión de prueba (¿está vivo el daemon?)
+                    except Exception as e:  # p.ej. un objeto que no se puede deserializar
+                        print(f"[WARN] Trabajo ilegible: {type(e).__name__}: {e}")
+                        continue
+                    if isinstance(job, dict) and job.get("cmd") == "shutdown":
+                        conn.send({"ok": True})
+                        break
+
+                    try:
+                        job = parse_job(job)
+                    except ValueError as e:
+                        print(f"[WARN] Trabajo rechazado: {e}")
+                        conn.send({"ok": False, "error": f"ValueError: {e}"})
+                        continue
+
+                    t0 = time.time()
+                    try:
+                        champs = run_training_parallel(**job, pool=pool, workers=workers)
+                        reply = {"ok": True, "champions": champs, "seconds": time.time() - t0}
+                    except Exception as e:
+                        reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+                    # Un error puede dejar ejecuciones en curso: pool nuevo (barato con forkserver)
+                    if not reply["ok"]:
+                        pool.terminate()
+                        pool.join()
+                        pool = ctx.Pool(workers)
+
+                    print(f"Trabajo seed={job['seed']} terminado: {reply}")
+                    conn.send(reply)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def submit_job(address=DAEMON_ADDRESS, authkey=None, **job) -> dict:
+    """Envía un trabajo al daemon y espera la respuesta (bloqueante)."""
+    with Client(address, authkey=authkey or daemon_authkey()) as conn:
+        conn.send(job)
+        return conn.recv()
+
+
+# ------------------------------------------------------------
+def parse_address(text):
+    host, _, port = text.rpartition(":")
+    return host or DAEMON_ADDRESS[0], int(port)
+
+
 def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument("--runs", type=int, default=20)
     parser.add_argument("--games-per-run", type=int, default=200)
     parser.add_argument("--shuffle", action=argparse.BooleanOptionalAction, default=True)
     parser.add_argument("--seed", type=int, default=911)
+    parser.add_argument("--stop-when-converged", action="store_true",
+                        help="parar cuando los ratings Elo se estabilicen")
+    parser.add_argument("--serve", action="store_true",
+                        help="quedarse como daemon atendiendo trabajos (ver auto_runner.py)")
+    parser.add_argument("--address", type=parse_address,
+                        default=DAEMON_ADDRESS, help="host:puerto del daemon")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="procesos de entrenamiento (por defecto cpu_count)")
+    parser.add_argument("--columnar", action="store_true",
+                        help=f"guardar también los resultados por columnas en {COLUMNAR_DIR}/")
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
 
+    if args.serve:
+        serve(args.address, workers=args.workers)
+        raise SystemExit(0)
+
     champs = run_training_parallel(
         runs=args.runs,
         shuffle=args.shuffle,
         seed=args.seed,
-        games_per_run=args.games_per_run
+        games_per_run=args.games_per_run,
+        stop_when_converged=args.stop_when_converged,
+        workers=args.workers,
+        columnar=args.columnar,
     )
 
     print("\n=== TRAINING FINISHED ===")
-    print("Campeones por worker:")
+    print("Campeones por knockout:")
     counter = Counter(champs)
     for name, cnt in counter.most_common():
         print(f"  {name}: {cnt}")
-    print("Logs guardados en logs/training_results.csv")
+    print(f"Logs guardados en {CSV_PATH}")
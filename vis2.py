@@ -2,6 +2,9 @@ import os
 import json
 import re
 
+from connect4.archive import ArchiveReader
+from connect4.dtos import game_history
+
 # ============================================================
 # Colores ANSI
 # ============================================================
@@ -91,7 +94,7 @@ def menu(options, title):
 # ============================================================
 def show_game(game):
 
-    history = game["history"]
+    history = game_history(game)
     plus1_name = game.get("player_plus1", "Jugador +1")
     minus1_name = game.get("player_minus1", "Jugador -1")
 
@@ -192,13 +195,34 @@ def process_file(path):
         show_game(games[choice - 1])
 
 
+# ============================================================
+# Archivo de partidas (.c4a): se pide el número de partida
+# ============================================================
+def process_archive(path):
+    with ArchiveReader(path) as reader:
+        n = len(reader)
+        while True:
+            print(f"\nArchivo: {os.path.basename(path)} ({n} partidas)")
+            try:
+                choice = int(input(f"Número de partida (1-{n}, 0 para volver): "))
+            except ValueError:
+                print("❌ Opción inválida")
+                continue
+            if choice == 0:
+                break
+            if 1 <= choice <= n:
+                show_game(reader[choice - 1].model_dump())
+            else:
+                print("❌ Opción inválida")
+
+
 # ============================================================
 # MAIN
 # ============================================================
 def main():
     directory = "./versus"
     pattern = re.compile(r"match_Group [A-H]_vs_Group [A-H]\.json$")
-    files = [f for f in os.listdir(directory) if pattern.match(f)]
+    files = [f for f in os.listdir(directory) if pattern.match(f) or f.endswith(".c4a")]
 
     if not files:
         print("❌ No se encontraron archivos JSON")
@@ -209,7 +233,11 @@ def main():
         if choice == 0:
             print("Saliendo...")
             return
-        process_file(os.path.join(directory, files[choice - 1]))
+        path = os.path.join(directory, files[choice - 1])
+        if path.endswith(".c4a"):
+            process_archive(path)
+        else:
+            process_file(path)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,9 @@ import json
 import os
 import re
 
+from connect4.archive import ArchiveReader
+from connect4.dtos import game_history
+
 # ================================
 # Colores ANSI
 # ================================
@@ -61,6 +64,57 @@ def print_board(board):
         print(line)
     print()
 
+# ================================
+# Mostrar UNA partida (dict del JSON o de un archivo .c4a)
+# ================================
+def show_final(idx, game):
+    print(f"--- PARTIDA {idx} ---")
+
+    # VALIDACIÓN DEL FORMATO (tableros completos o lista de jugadas)
+    if not isinstance(game, dict) or ("history" not in game and "moves" not in game):
+        print(RED + "Partida vacía o corrupta\n" + RESET)
+        return
+
+    history = game_history(game)
+
+    if not history:
+        print(RED + "Partida vacía\n" + RESET)
+        return
+
+    # Jugadores en esta partida
+    plus1 = game.get("player_plus1", "Desconocido")
+    minus1 = game.get("player_minus1", "Desconocido")
+
+    # Extraer último movimiento
+    last_state, last_col = history[-1]
+
+    # Clonar tablero
+    board = [row[:] for row in last_state]
+
+    # Determinar qué jugador hizo ese movimiento
+    turn = len(history)    # turno actual
+    player = 1 if turn % 2 == 0 else -1
+
+    # Aplicar movimiento final si falta
+    apply_move(board, last_col, player)
+
+    print(f"Última jugada: columna {last_col} (jugador {'+1' if player==1 else '-1'})")
+    print(f"{('+1 = ' + plus1) if player==1 else ('-1 = ' + minus1)}\n")
+
+    print("Tablero final:\n")
+    print_board(board)
+
+    winner = check_winner(board)
+
+    if winner == 1:
+        print("Ganador:", BLUE + f"{plus1} (+1)" + RESET)
+    elif winner == -1:
+        print("Ganador:", RED + f"{minus1} (-1)" + RESET)
+    else:
+        print("Resultado: Empate o sin 4 en línea")
+    print()
+
+
 # ================================
 # Procesar UN archivo
 # ================================
@@ -88,51 +142,21 @@ def process_file(path):
     print("=== DETALLE POR PARTIDA ===\n")
 
     for idx, game in enumerate(games, start=1):
-        print(f"--- PARTIDA {idx} ---")
-
-        # VALIDACIÓN DEL NUEVO FORMATO
-        if not isinstance(game, dict) or "history" not in game:
-            print(RED + "Partida vacía o corrupta\n" + RESET)
-            continue
-
-        history = game["history"]
-
-        if not history:
-            print(RED + "Partida vacía\n" + RESET)
-            continue
-
-        # Jugadores en esta partida
-        plus1 = game.get("player_plus1", "Desconocido")
-        minus1 = game.get("player_minus1", "Desconocido")
-
-        # Extraer último movimiento
-        last_state, last_col = history[-1]
+        show_final(idx, game)
 
-        # Clonar tablero
-        board = [row[:] for row in last_state]
-
-        # Determinar qué jugador hizo ese movimiento
-        turn = len(history)    # turno actual
-        player = 1 if turn % 2 == 0 else -1
-
-        # Aplicar movimiento final si falta
-        apply_move(board, last_col, player)
-
-        print(f"Última jugada: columna {last_col} (jugador {'+1' if player==1 else '-1'})")
-        print(f"{('+1 = ' + plus1) if player==1 else ('-1 = ' + minus1)}\n")
-
-        print("Tablero final:\n")
-        print_board(board)
+# ================================
+# Procesar un archivo de partidas (.c4a)
+# ================================
+def process_archive(path):
+    print("\n===================================")
+    print(f"📦 Archivo de partidas: {path}")
+    print("===================================\n")
 
-        winner = check_winner(board)
+    with ArchiveReader(path) as reader:
+        print(f"Partidas: {len(reader)}\n")
+        for n, game in reader.iter_games():
+            show_final(n + 1, game.model_dump())
 
-        if winner == 1:
-            print("Ganador:", BLUE + f"{plus1} (+1)" + RESET)
-        elif winner == -1:
-            print("Ganador:", RED + f"{minus1} (-1)" + RESET)
-        else:
-            print("Resultado: Empate o sin 4 en línea")
-        print()
 
 # ================================
 # EJECUCIÓN PRINCIPAL
@@ -142,9 +166,12 @@ directory = "./versus"
 pattern = re.compile(r"match_Group [A-H]_vs_Group [A-H]\.json$")
 
 files = [f for f in os.listdir(directory) if pattern.match(f)]
+archives = [f for f in os.listdir(directory) if f.endswith(".c4a")]
 
-if not files:
+if not files and not archives:
     print("❌ No se encontraron archivos en ./versus/")
 else:
     for fname in files:
         process_file(os.path.join(directory, fname))
+    for fname in archives:
+        process_archive(os.path.join(directory, fname))